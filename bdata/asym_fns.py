@@ -11,18 +11,19 @@ def get_4counter(Fp, Fn, Bp, Bn):
     Inputs are counter np.arrays
     """
 
-    # pre-calcs
+    # mask of bins with a well-defined ratio, computed once up front so the
+    # bad bins never round-trip through nan and the inputs are not modified
     r_denom = Fp*Bn
-    r_denom[r_denom==0] = np.nan
-    r = np.sqrt((Bp*Fn/r_denom))
-    r[r==-1] = np.nan
+    good = r_denom != 0
+
+    ratio = np.divide(Bp*Fn, r_denom, out=np.zeros_like(r_denom), where=good)
+    good &= ratio >= 0
+
+    r = np.sqrt(ratio, out=ratio, where=good)
+
+    # combined asymmetry, zero in the bad bins
+    asym_comb = np.divide(r-1, r+1, out=np.zeros_like(r_denom), where=good)
 
-    # combined asymmetry
-    asym_comb = (r-1)/(r+1)
-    
-    # replace nan with zero 
-    asym_comb[np.isnan(asym_comb)] = 0.
-    
     return asym_comb
 
 # =======================================================================
@@ -32,24 +33,33 @@ def get_4counter_err(Fp, Fn, Bp, Bn):
     Inputs are counter np.arrays
     """
 
-    # pre-calcs
+    # mask of bins with a well-defined ratio, computed once up front so the
+    # bad bins never round-trip through nan and the inputs are not modified
     r_denom = Fp*Bn
-    r_denom[r_denom==0] = np.nan
-    r = np.sqrt((Bp*Fn/r_denom))
-    r[r==-1] = np.nan
+    good = r_denom != 0
+
+    ratio = np.divide(Bp*Fn, r_denom, out=np.zeros_like(r_denom), where=good)
+    good &= ratio >= 0
+
+    r = np.sqrt(ratio, out=ratio, where=good)
 
     # check for div by zero
-    Fp[Fp==0] = np.nan                  
-    Bp[Bp==0] = np.nan
-    Fn[Fn==0] = np.nan
-    Bn[Bn==0] = np.nan
-    
-    # error in combined asymmetry
-    asym_comb_err = r*np.sqrt(1/Bp + 1/Fp + 1/Bn + 1/Fn)/np.square(r+1)
-    
-    # replace nan with zero 
-    asym_comb_err[np.isnan(asym_comb_err)] = 0.
-    
+    good &= (Fp != 0) & (Fn != 0) & (Bp != 0) & (Bn != 0)
+
+    # sum of inverse counts
+    inv_sum = np.zeros_like(r_denom)
+    inv = np.zeros_like(r_denom)
+    for counts in (Bp, Fp, Bn, Fn):
+        np.divide(1.0, counts, out=inv, where=good)
+        inv_sum += inv
+
+    # error in combined asymmetry, zero in the bad bins
+    rp1 = r+1
+    asym_comb_err = np.divide(r*np.sqrt(inv_sum, out=inv_sum, where=good),
+                              rp1*rp1,
+                              out=np.zeros_like(r_denom),
+                              where=good)
+
     return asym_comb_err
 
 # =======================================================================
@@ -97,11 +107,66 @@ def get_4counter_err_bkgd(Fp, Fn, Bp, Bn, n_prebeam):
     # error in asymmetry
     asym_comb_err = r_err * 2/(r+1)**2
 
-    # replace nan with zero 
-    asym_comb_err[np.isnan(asym_comb_err)] = 0.
-    
+    # replace nan with zero, in one pass without a mask array
+    np.nan_to_num(asym_comb_err, copy=False, nan=0.0,
+                  posinf=np.inf, neginf=-np.inf)
+
     return asym_comb_err
 
+# ======================================================================= #
+def get_2e_raw(Fp, Fn, Bp, Bn):
+    """
+    Find the raw asymmetries for 2e mode: both two-counter asymmetries and
+    the four-counter asymmetry, with errors.
+    Inputs are counter np.arrays of shape [freq, time bin]
+
+    Returns (asym_p, asym_p_err, asym_m, asym_m_err, asym_4, asym_4_err)
+    """
+
+    # counter sums, each needed by a value and its error
+    sp = Bp+Fp
+    sm = Bn+Fn
+
+    # two counter
+    asym_p = (Bp-Fp)/sp
+    asym_m = (Bn-Fn)/sm
+
+    # reciprocal counts, shared between r and the four-counter error:
+    # four multiplies replace four of the five elementwise divisions
+    iFp = np.reciprocal(Fp)
+    iFn = np.reciprocal(Fn)
+    iBp = np.reciprocal(Bp)
+    iBn = np.reciprocal(Bn)
+
+    # four counter
+    r = np.sqrt((Bp*Fn)*(iBn*iFp))
+    rp1 = r+1
+    asym_4 = (r-1)/rp1
+
+    # errors: 2*sqrt(Bp*Fp)/sp**1.5 etc, built in place to avoid
+    # allocating a temporary per operation; s*sqrt(s) is cheaper than
+    # the pow call in s**1.5
+    asym_p_err = Bp*Fp
+    np.sqrt(asym_p_err, out=asym_p_err)
+    asym_p_err *= 2
+    asym_p_err /= sp*np.sqrt(sp)
+
+    asym_m_err = Bn*Fn
+    np.sqrt(asym_m_err, out=asym_m_err)
+    asym_m_err *= 2
+    asym_m_err /= sm*np.sqrt(sm)
+
+    # r*sqrt(1/Bp+1/Bn+1/Fp+1/Fn)/(r+1)**2, accumulated in place from
+    # the shared reciprocals
+    asym_4_err = iBp+iBn
+    asym_4_err += iFp
+    asym_4_err += iFn
+    np.sqrt(asym_4_err, out=asym_4_err)
+    asym_4_err *= r
+    asym_4_err /= rp1*rp1
+
+    return asym_p, asym_p_err, asym_m, asym_m_err, asym_4, asym_4_err
+
 # ======================================================================= #
 def get_simple(F, B):
     """
@@ -111,17 +176,13 @@ def get_simple(F, B):
     
     # pre-calcs
     denom = F+B
-    
-    # check for div by zero
-    denom[denom==0] = np.nan          
-    
+
+    # mask the div by zero up front: bad bins stay zero in the output
+    # rather than round-tripping through nan
+    good = denom != 0
+
     # asymmetries
-    asym = (F-B)/denom
-                
-    # remove nan            
-    asym[np.isnan(asym)] = 0.
-        
-    return asym
+    return np.divide(F-B, denom, out=np.zeros_like(denom), where=good)
 
 # ======================================================================= #
 def get_simple_err(F, B):
@@ -132,17 +193,21 @@ def get_simple_err(F, B):
     
     # pre-calcs
     denom = F+B
-    
-    # check for div by zero
-    denom[denom==0] = np.nan          
-    
-    # errors 
+
+    # mask the div by zero up front: bad bins stay zero in the output
+    # rather than round-tripping through nan
+    good = denom != 0
+    inv = np.divide(1., denom, out=np.zeros_like(denom), where=good)
+
+    # errors: 2*sqrt(F*B/denom**3), via the reciprocal to skip the power
     # https://www.wolframalpha.com/input/?i=%E2%88%9A(F*(derivative+of+((F-B)%2F(F%2BB))+with+respect+to+F)%5E2+%2B+B*(derivative+of+((F-B)%2F(F%2BB))+with+respect+to+B)%5E2)
-    asym_err = 2*np.sqrt(F*B/np.power(denom, 3))
-    
-    # remove nan            
-    asym_err[np.isnan(asym_err)] = 0.
-        
+    prod = F*B*(inv*inv*inv)
+    good &= prod >= 0
+
+    asym_err = np.zeros_like(denom)
+    np.sqrt(prod, out=asym_err, where=good)
+    asym_err *= 2
+
     return asym_err
     
 # ======================================================================= #
@@ -182,9 +247,10 @@ def get_simple_err_bkgd(F, B, n_prebeam):
     # errors 
     asym_err = 2 * np.sqrt( vF*(B/(F+B)**2)**2 + vB*(F/(F+B)**2)**2)
     
-    # remove nan            
-    asym_err[np.isnan(asym_err)] = 0.
-        
+    # remove nan, in one pass without a mask array
+    np.nan_to_num(asym_err, copy=False, nan=0.0,
+                  posinf=np.inf, neginf=-np.inf)
+
     return asym_err
 
 # ======================================================================= #
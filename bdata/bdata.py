@@ -5,17 +5,178 @@
 
 import bdata as bd
 import numpy as np
-import pandas as pd
-import os, re
-import datetime, warnings, requests
+import functools, math, os, pickle, re, stat, sys, types
+import time, warnings, requests
+from concurrent.futures import ThreadPoolExecutor
 from .exceptions import MinimizationError, InputError, DkeyWarning, IOWarning
 from .containers import hdict, vdict
 import bdata.asym_fns as asy
 
 from mudpy import mdata
 from mudpy.containers import mdict
-from iminuit import Minuit
-from scipy.optimize import curve_fit
+
+# translation table deleting non-word characters: the ascii equivalent of
+# re.sub(r'\W', '', ...), without entering the regex engine
+_NONWORD_TABLE = {o: None for o in range(128)
+                  if not (chr(o).isalnum() or chr(o) == '_')}
+
+# precompiled patterns for 1x-mode key normalization: skips the re module's
+# compile-cache lookup on every title
+_DIGITS_RE = re.compile('[0-9]+')
+
+# hist_select delimiters, collapsed to spaces in a single pass
+_HIST_DELIM_TABLE = str.maketrans(',;.', '   ')
+
+def _default_title(title):
+    """Normalize a variable title into an attribute-friendly default key."""
+
+    cleaned = title.replace(' ', '_')
+
+    # most titles are already clean: isidentifier is a single C-level scan,
+    # so only pay for the character stripping when it will change something
+    if cleaned.isidentifier():
+        return cleaned
+
+    return cleaned.translate(_NONWORD_TABLE)
+
+# cache of resolved PPG titles: the same titles recur across runs, so the
+# regex-based 1x-mode normalization runs once per distinct title per process
+_ppg_title_cache = {}
+
+def _get_ppg_key(title):
+    """Resolve a lowercased PPG variable title to its friendly dictionary key.
+
+    Returns (key, known) where known is False if the title could not be
+    matched in dkeys, in which case the key is a cleaned-up default.
+    """
+
+    try:
+        return _ppg_title_cache[title]
+    except KeyError:
+        pass
+
+    key = _DKEYS.get(title)
+    if key is not None:
+        resolved = (key, True)
+    else:
+
+        # check for 1x mode keys: strip the digits and reattach them to the
+        # resolved name
+        title_1x = _DIGITS_RE.sub('', title)
+        num = _DIGITS_RE.search(title)
+
+        if title_1x in _DKEYS and num is not None:
+            resolved = ('%s_%s' % (_DKEYS[title_1x], num.group()), True)
+        else:
+            resolved = (_default_title(title), False)
+
+    _ppg_title_cache[title] = resolved
+    return resolved
+
+def _cast_hists_float64(hist):
+    """Cast all histogram data to float64, grouped into shared blocks.
+
+    Histograms of matching shape become rows of one contiguous 2D array
+    and keep views into it, so the counter arithmetic downstream
+    (ex: F+ - F-) streams through adjacent memory instead of four
+    scattered allocations.
+    """
+
+    groups = {}
+    for h in hist.values():
+        if h.data.dtype != np.float64:
+            groups.setdefault(h.data.shape, []).append(h)
+
+    for shape, hists in groups.items():
+        block = np.empty((len(hists),) + shape, dtype=np.float64)
+
+        for i, h in enumerate(hists):
+            block[i] = h.data
+            h.data = block[i]
+
+def _dkey_warnings_ignored():
+    """Check whether DkeyWarning is filtered to 'ignore', so the unknown-key
+    messages need not be formatted at all.
+
+    Conservative: any message- or module-specific filter that could match
+    the warning forces the messages to be built.
+    """
+
+    for action, msg, cat, mod, lineno in warnings.filters:
+
+        if not issubclass(DkeyWarning, cat):
+            continue
+
+        # filter depends on the message or source: can't decide up front
+        if msg is not None or mod is not None or lineno != 0:
+            return False
+
+        return action == 'ignore'
+
+    return False
+
+# cache of resolved data directories, keyed by (spectrometer, year), so batch
+# loaders don't redo the environment and path lookups for every run
+_dir_cache = {}
+
+def _get_data_dir(spect_dir, evar, year):
+    """Get (and memoize) the directory holding the msr files for a
+    spectrometer and year."""
+
+    try:
+        return _dir_cache[(spect_dir, year)]
+    except KeyError:
+        pass
+
+    directory = os.environ.get(evar)
+    if not directory:
+        directory = os.path.join(bd._mud_data, spect_dir)
+
+    directory = os.path.join(directory, str(year))
+    _dir_cache[(spect_dir, year)] = directory
+
+    return directory
+
+@functools.lru_cache(maxsize=32)
+def _parse_bin_ranges(ranges):
+    """Parse a tuple of bin index strings ("5", or the inclusive "1-10")
+    into an array of non-negative bin indices. Cached: bdata._kill_bins
+    would otherwise reparse the same user input on every asym call."""
+
+    bin_ranges = []
+    for b in ranges:
+        if not '-' in b:
+            bin_ranges.append(int(b))
+        else:
+            one = int(b.split('-')[0])
+            two = int(b.split('-')[1])
+            bin_ranges.extend(np.arange(one, two+1))
+
+    bin_ranges = np.array(bin_ranges, dtype=int)
+    return bin_ranges[bin_ranges >= 0]
+
+def _deadtime_chi(p, dp, n, dn, c):
+    """Chi2 of the split-helicity midpoints about their weighted average,
+    the quantity minimized by bdata.get_deadtime."""
+
+    # midpoints
+    midpts = 0.5*(p + c*n)
+
+    # inverse of 4x the midpoint variance, built in place
+    w = c*dn
+    w *= w
+    w += dp*dp
+    np.reciprocal(w, out=w)
+
+    # weighted average midpoint: a BLAS dot plus one reduction, rather
+    # than np.average's broadcast-multiply temporary
+    avgmid = (midpts @ w) / w.sum()
+
+    # get chi2: the 0.25 in the variance folds into a factor of 4
+    midpts -= avgmid
+    midpts *= midpts
+    midpts *= w
+    return 4*midpts.mean()
 
 __doc__="""
     Beta-data module. The bdata object is largely a data container, designed to
@@ -90,418 +251,455 @@ __doc__="""
     Nov 2019
 """
 
-# =========================================================================== #
-class bdata(mdata):
-    """
-        Class fields
-            dkeys
-            evar_bnmr
-            evar_bnqr
+# set nice dictionary keys
+
+# PPG (just the stuff after the last "/")
+_DKEYS_PPG = {
+    "e20 beam on dwelltimes"            :"beam_on",
+    "e00 beam on dwelltimes"            :"beam_on",
+    "e20  beam off dwelltimes"          :"beam_off",
+    "e20 beam off dwelltimes"           :"beam_off",
+    "e00 beam off dwelltimes"           :"beam_off",
+    "beam off time (ms)"                :"beam_off_ms",
+
+    "constant time between cycles"      :"const_t_btwn_cycl",
+    "e1f const time between cycles"     :"const_t_btwn_cycl",
+
+    "Custom var enabled"                :"customv_enable",
+    "Custom var read name"              :"customv_name_read",
+    "Custom var write name"             :"customv_name_write",
+
+    "Start custom scan"                 :"customv_scan_start",
+    "Stop custom scan"                  :"customv_scan_stop",
+    "Custom Increment"                  :"customv_scan_incr",
+
+    "scan device"                       :"scan_device",
+
+    "scan start"                        :"scan_start",
+    "scan stop"                         :"scan_stop",
+    "scan incr"                         :"scan_incr",
+    "scan increment"                    :"scan_incr",
+
+    "NaVolt start (volts)"              :"scan_start",
+    "NaVolt stop (volts)"               :"scan_stop",
+    "NaVolt inc (volts)"                :"scan_incr",
+
+    "laser start (volts)"               :"scan_start",
+    "laser stop (volts)"                :"scan_stop",
+    "laser inc (volts)"                 :"scan_incr",
+
+    "field start (gauss)"               :"scan_start",
+    "field stop (gauss)"                :"scan_stop",
+    "field inc (gauss)"                 :"scan_incr",
+
+    "DAQ drives sampleref"              :"smpl_ref_daq_drive",
+    "DAQ service time (ms)"             :"service_t",
+    "Dwell time (ms)"                   :"dwelltime",
+    "Bin width (ms)"                    :"dwelltime",
+
+    "Enable helicity flipping"          :"hel_enable",
+    "Enable RF"                         :"rf_enable",
+    "enable sampleref mode"             :"smpl_ref_enable",
+
+    "Field start (Gauss)"               :"field_start",
+    "Field stop (Gauss)"                :"field_stop",
+    "Field inc (Gauss)"                 :"field_incr",
+
+    "frequency increment (Hz)"          :"freq_incr",
+    "frequency start (Hz)"              :"freq_start",
+    "frequency stop (Hz)"               :"freq_stop",
+
+    "scan var histo factor"             :"scan_var_histo_factor",
+
+    "init mode file"                    :"init_mode",
+    "init mode"                         :"init_mode",
+
+    "helicity flip sleep (ms)"          :"hel_sleep",
+    "Helicity flip sleep(ms)"           :"hel_sleep",
+
+    "num bins"                          :"nbins",
+    "num cycles per supercycle"         :"ncycles",
+    "Number dwelltimes per freq"        :"ndwell_per_f",
+    "number of midbnmr regions"         :"nregion",
+    "num post RF beamOn dwelltimes"     :"ndwell_post_on",
+
+    "Param X Start"                     :'xstart',
+    "Param X Stop"                      :'xstop',
+    "Param X Incr"                      :'xincr',
+    "Constant param Y"                  :'yconst',
+
+    "f1 frequency function"             :"freqfn_f1",
+    "f2 frequency function"             :"freqfn_f2",
+    "f3 frequency function"             :"freqfn_f3",
+    "f4 frequency function"             :"freqfn_f4",
+
+    "PPG mode"                          :"mode",
+    "e20 prebeam dwelltimes"            :"prebeam",
+    "e00 prebeam dwelltimes"            :"prebeam",
+    "psm onef enabled"                  :"onef_enable",
+    "psm onef scale factor"             :"onef_scale",
+    "psm fREF enabled"                  :"fref_enable",
+    "psm fREF scale factor"             :"fref_scale",
+    "psm scale factor"                  :"psm_scale",
+    "psm scaler factor"                 :"psm_scale",
+
+    "randomize freq increments"         :"rand_freq_incr",
+    "Randomize freq values"             :"rand_freq_val",
+    "Ref tuning freq (Hz)"              :"ref_tune_freq",
+    "Ref tuning frequency (Hz)"         :"ref_tune_freq",
+    "e20 rf frequency (Hz)"             :"freq",
+    "e00 rf frequency (Hz)"             :"freq",
+    "RFon delay (dwelltimes)"           :"rf_on_delay",
+    "num RF on delays (dwell times)"    :"rf_on_delay",
+    "RFon duration (dwelltimes)"        :"rf_on",
+    "RF on time (ms)"                   :"rf_on_ms",
+    "RF enabled"                        :"rf_enable",
+
+    'num finer freq regions'            :'fine_freq_nregions',
+    'fine freq start  (hz)'             :'fine_freq_start',
+    'fine freq end  (hz)'               :'fine_freq_end',
+    'fine freq increment  (hz)'         :'fine_freq_increment',
+
+    "Single tone simulated"             :"sgle_tone_sim",
+
+    "use defaults for midbnmr"          :"defaults",
+
+    "probe species"                     :"probe_species",
+}
+
+# CAMP
+_DKEYS_CAMP = {
+
+    "/biasV/input1"                             :"rb_cell_bias_set",
+    "/biasV/output1"                            :"rb_cell_bias_read",
+
+    "/CryoEx_MassFlow/read_flow"                :"cryo_read",
+    "/CryoEx_MassFlow/set_flow"                 :"cryo_set",
+    "/Cryo_level/He_level"                      :"cryo_he",
+    "/Cryo_level/N2_level"                      :"cryo_n2",
+    "/cryo_lift/set_position"                   :"clift_set",
+    "/cryo_lift/read_position"                  :"clift_read",
+
+    "/Cryo_oven/current_read_1"                 :"oven_current",
+    "/Cryo_oven/output_1/D"                     :"oven_out_d",
+    "/Cryo_oven/output_1/I"                     :"oven_out_i",
+    "/Cryo_oven/output_1/P"                     :"oven_out_p",
+    "/Cryo_oven/read_A"                         :"oven_readA",
+    "/Cryo_oven/read_B"                         :"oven_readB",
+    "/Cryo_oven/read_C"                         :"oven_readC",
+    "/Cryo_oven/read_D"                         :"oven_readD",
+    "/Cryo_oven/setpoint_1"                     :"oven_set1",
+
+    "/Dac0/dac_set"                             :"dac_set",
+    "/dac/dac_set"                              :"dac_set",
+    "/Dewar/He_level"                           :"he_level",
+
+    "/flow_set/output"                          :"flow_set_out",
+
+    "/He_flow/read_flow"                        :"he_read",
+    "/He_flow/set_flow"                         :"he_set",
+
+    "/lock-in/R"                                :"lockin_r",
+    "/lock-in/theta"                            :"lockin_theta",
+    "/lock-in/X"                                :"lockin_x",
+    "/lock-in/Y"                                :"lockin_y",
+
+    "/Magnet/mag_field"                         :"b_field",
+    "/Magnet/mag_set"                           :"b_field_setpt",
+    "/Magnet/mag_read"                          :"mag_current",
+    "/Magnet/controls/sys_status"               :"mag_ctrl_status",
+    "/Magnet/ramp_status"                       :"mag_ramp_status",
+    "/Magnet/volts"                             :"mag_voltage",
+    "/mass_flow/read_flow"                      :"mass_read",
+    "/mass_flow/set_flow"                       :"mass_set",
+
+    "/needle-valve/read_position"               :"needle_read",
+    "/Needle/read_position"                     :"needle_pos",
+    "/Needle/motor_position"                    :"needle_pos",
+    "/needle-valve/set_position"                :"needle_set",
+    "/Needle_Valve/set_position"                :"needle_set",
+    "/Needle/set_position"                      :"needle_set",
+
+    "/PVac/adc_read"                            :"vac",
+
+    "/rfamp/fwd_max"                            :"rfamp_fwd",
+    "/rfamp/fwd_power"                          :"rfamp_fpwr",
+    "/rfamp/refl_max"                           :"rfamp_rfl",
+    "/rfamp/RF_gain"                            :"rfamp_rfgain",
+    "/rf_level_cont/dac_set"                    :"rf_dac",
+
+    "/Sample/current_read_1"                    :"smpl_current",
+    "/Sample/current_read"                      :"smpl_current",
+    "/Sample1/current_read"                     :"smpl_current",
+    "/Sample/sample_read"                       :"smpl_read_A",
+    "/Sample/read_A"                            :"smpl_read_A",
+    "/Sample1/read_A"                           :"smpl_read_A",
+    "/Sample/read_B"                            :"smpl_read_B",
+    "/Sample1/read_B"                           :"smpl_read_B",
+    "/adc0/adc_read"                            :"smpl_read_B",
+    "/Sample/read_C"                            :"smpl_read_C",
+    "/Sample/read_D"                            :"smpl_read_D",
+    "/Sample/set_current"                       :"smpl_set_current",
+    "/Sample/setpoint"                          :"smpl_set",
+    "/Sample1/setpoint"                         :"smpl_set",
+    "/Sample/setpoint_1"                        :"smpl_set",
+    "/sample2/heat_range"                       :"smpl2_heat",
+    "/sample2/sample_read"                      :"smpl2_read",
+    "/sample_volts/reading"                     :"smpl_volts",
+    "/Shield/read_1"                            :"shield_read1",
+    "/signal_gen/amplitude"                     :"sig_gen_amp",
+    "/signal_gen/frequency"                     :"sig_gen_freq",
+    "/signal_gen/power_level"                   :"sig_gen_pwr",
+    "/signal_gen/rf_on"                         :"sig_gen_rfon",
+    "/stealth/fwd_max"                          :"stealth_fwd_max",
+    "/stealth/fwd_power"                        :"stealth_fwd_pwr",
+    "/stealth/rev_max"                          :"stealth_rev_max",
+    "/stealth/rev_power"                        :"stealth_rev_pwr",
+}
+
+# EPICS
+_DKEYS_EPICS = {
+    "BNMR:HVBIAS:P"                             :"nmr_bias",
+    "BNMR:HVBIAS:PO"                            :"nmr_bias",
+    "BNMR:HVBIAS:POS"                           :"nmr_bias",
+    "BNMR:HVBIAS:POS:"                          :"nmr_bias",
+    "BNMR:HVBIAS:POS:R"                         :"nmr_bias",
+    "BNMR:HVBIAS:POS:RDVO"                      :"nmr_bias",
+    "BNMR:HVBIAS:POS:RDVOL"                     :"nmr_bias",
+    "BNMR:HVBIAS:POS:RDVOL1"                    :"nmr_bias",
+
+    "BNMR:HVBIAS:N"                             :"nmr_bias_n",
+    "BNMR:HVBIAS:NE"                            :"nmr_bias_n",
+    "BNMR:HVBIAS:NEG"                           :"nmr_bias_n",
+    "BNMR:HVBIAS:NEG:"                          :"nmr_bias_n",
+    "BNMR:HVBIAS:NEG:R"                         :"nmr_bias_n",
+    "BNMR:HVBIAS:NEG:RDVO"                      :"nmr_bias_n",
+    "BNMR:HVBIAS:NEG:RDVOL"                     :"nmr_bias_n",
+    "BNMR:HVBIAS:NEG:RDVOL1"                    :"nmr_bias_n",
+
+    "BNQR:HVBIAS:RD"                            :"nqr_bias",
+    "BNQR:HVBIAS:RDVOL"                         :"nqr_bias",
+
+    "ITE:BIAS:RDVO"                             :"target_bias",
+    "ITE:BIAS:RDVOL"                            :"target_bias",
+    "ITE:BIAS:RDVOLER"                          :"target_bias",
+    "ITE:BIAS:RDVOLVOL"                         :"target_bias",
+    "ITW:BIAS:R"                                :"target_bias",
+    "ITW:BIAS:RD"                               :"target_bias",
+    "ITW:BIAS:RDV"                              :"target_bias",
+    "ITW:BIAS:RDVO"                             :"target_bias",
+    "ITW:BIAS:RDVOL"                            :"target_bias",
+    "ITW:BIAS:RDVOL1"                           :"target_bias",
+    "ITW:BIAS:RDVOLVOL"                         :"target_bias",
+
+    "ILE2:BIAS15:R"                             :"bias15",
+    "ILE2:BIAS15:RD"                            :"bias15",
+    "ILE2:BIAS15:RDV"                           :"bias15",
+    "ILE2:BIAS15:RDVO"                          :"bias15",
+    "ILE2:BIAS15:RDVOL"                         :"bias15",
+
+    "ILE2:LAS:RDPO"                             :"las_pwr",
+    "ILE2:LAS:RDPOW"                            :"las_pwr",
+    "ILE2:LAS:RDPOWE"                           :"las_pwr",
+    "ILE2:LAS:RDPOWER"                          :"las_pwr",
+    "ILE2:LAS:RDPOWERL"                         :"las_pwr",
+
+    "ILE2:BIASTUBE:"                            :"biastube",
+    "ILE2:BIASTUBE:V"                           :"biastube",
+    "ILE2:BIASTUBE:VOL"                         :"biastube",
+    "ILE2:BIASTUBE:RDVOL"                       :"biastube",
+
+    "ILE2:DPPLR:CH0:HW:RDVOL"                   :"dopplertube_ch0",
+    "ILE2:DPPLR:CH1:HW:RDVOL"                   :"dopplertube_ch1",
+    "ILE2:DPPLR:CH2:HW:RDVOL"                   :"dopplertube_ch2",
+
+    "BNMR:EL3:RDVOL"                            :"el3",
+
+    "ILE2A1:HH:CUR"                             :"hh_current",
+    "ILE2A1:HH:RDCU"                            :"hh_current",
+    "ILE2A1:HH:RDCUR"                           :"hh_current",
+    "ILE2A1:HH3:RDCUR"                          :"hh_current",
+
+    "ILE2A1:HH6:RDCUR"                          :"hh6_current",
+
+    "TRILIS177:METER:LAMBDA1"                   :"las_lambda",
+    "TRILIS177:METER:WAVENUM1"                  :"las_wavenum",
+}
+
+_DKEYS = {"":"", **_DKEYS_CAMP, **_DKEYS_EPICS, **_DKEYS_PPG}
+
+# lower case keys, computed once at import rather than on every construction.
+# keys and values are interned so downstream lookups compare by pointer, and
+# the mapping is read-only so no code can invalidate it by mutation
+_DKEYS = types.MappingProxyType(
+    {sys.intern(k.lower()): sys.intern(i) for k, i in _DKEYS.items()})
+
+# mapping from old run attributes to new run attributes
+_OLD_ATTR = {
+    # histogram names
+        'FREQ'          :'Frequency',
+        'Bp'            :'B+',
+        'back+'         :'B+',
+        'Fp'            :'F+',
+        'front+'        :'F+',
+        'Bm'            :'B-',
+        'back-'         :'B-',
+        'Fm'            :'F-',
+        'front-'        :'F-',
+        'FluM'          :'FluM2',
+        'FluorMon2'     :'FluM2',
+        'PolLp'         :'L+',
+        'PolLeft+'      :'L+',
+        'PolRp'         :'R+',
+        'PolRight+'     :'R+',
+        'PolLm'         :'L-',
+        'PolLeft-'      :'L-',
+        'PolRm'         :'R-',
+        'PolRight-'     :'R-',
+        'NBMBp'         :'NBMB+',
+        'NeutBmB+'      :'NBMB+',
+        'NBMFp'         :'NBMF+',
+        'NeutBmF+'      :'NBMF+',
+        'NBMBm'         :'NBMB-',
+        'NeutBmB-'      :'NBMB-',
+        'NBMFm'         :'NBMF-',
+        'NeutBmF-'      :'NBMF-',
+
+    # method to mode conversion
+        'TI-Bnmr'       :'1f',
+        'TI-bNMR'       :'1f',
+
+        'TD-Bnmr'       :'20',
+        'TD-bNMR'       :'20',
+
+    # apparatus
+        'bnmr2'         :'BNMR',
+        'bnmr'          :'BNMR',
+    }
+_OLD_ATTR = types.MappingProxyType(
+    {sys.intern(k): sys.intern(i) for k, i in _OLD_ATTR.items()})
 
-        Data fields
-            slr_bkgd_corr: if true subtract hist prebeam mean from bins (SLR only)
-            slr_rm_prebeam: if true remove prebeam bins from output (SLR only)
-            ppg
-            epics
-            camp
-            + inherited fields from mdata
-    """
+# options for asymmetry calculation
+_OPTION = {  ''                      :'',
 
-    # set nice dictionary keys
+            'adif'                  :'alpha_diffusion',
+            'ad'                    :'alpha_diffusion',
+            'adiff'                 :'alpha_diffusion',
 
-    # PPG (just the stuff after the last "/")
-    dkeys_ppg = {
-        "e20 beam on dwelltimes"            :"beam_on",
-        "e00 beam on dwelltimes"            :"beam_on",
-        "e20  beam off dwelltimes"          :"beam_off",
-        "e20 beam off dwelltimes"           :"beam_off",
-        "e00 beam off dwelltimes"           :"beam_off",
-        "beam off time (ms)"                :"beam_off_ms",
-
-        "constant time between cycles"      :"const_t_btwn_cycl",
-        "e1f const time between cycles"     :"const_t_btwn_cycl",
-
-        "Custom var enabled"                :"customv_enable",
-        "Custom var read name"              :"customv_name_read",
-        "Custom var write name"             :"customv_name_write",
-
-        "Start custom scan"                 :"customv_scan_start",
-        "Stop custom scan"                  :"customv_scan_stop",
-        "Custom Increment"                  :"customv_scan_incr",
-
-        "scan device"                       :"scan_device",
-
-        "scan start"                        :"scan_start",
-        "scan stop"                         :"scan_stop",
-        "scan incr"                         :"scan_incr",
-        "scan increment"                    :"scan_incr",
-
-        "NaVolt start (volts)"              :"scan_start",
-        "NaVolt stop (volts)"               :"scan_stop",
-        "NaVolt inc (volts)"                :"scan_incr",
-
-        "laser start (volts)"               :"scan_start",
-        "laser stop (volts)"                :"scan_stop",
-        "laser inc (volts)"                 :"scan_incr",
-
-        "field start (gauss)"               :"scan_start",
-        "field stop (gauss)"                :"scan_stop",
-        "field inc (gauss)"                 :"scan_incr",
-
-        "DAQ drives sampleref"              :"smpl_ref_daq_drive",
-        "DAQ service time (ms)"             :"service_t",
-        "Dwell time (ms)"                   :"dwelltime",
-        "Bin width (ms)"                    :"dwelltime",
-
-        "Enable helicity flipping"          :"hel_enable",
-        "Enable RF"                         :"rf_enable",
-        "enable sampleref mode"             :"smpl_ref_enable",
-
-        "Field start (Gauss)"               :"field_start",
-        "Field stop (Gauss)"                :"field_stop",
-        "Field inc (Gauss)"                 :"field_incr",
-
-        "frequency increment (Hz)"          :"freq_incr",
-        "frequency start (Hz)"              :"freq_start",
-        "frequency stop (Hz)"               :"freq_stop",
-
-        "scan var histo factor"             :"scan_var_histo_factor",
-
-        "init mode file"                    :"init_mode",
-        "init mode"                         :"init_mode",
-
-        "helicity flip sleep (ms)"          :"hel_sleep",
-        "Helicity flip sleep(ms)"           :"hel_sleep",
-
-        "num bins"                          :"nbins",
-        "num cycles per supercycle"         :"ncycles",
-        "Number dwelltimes per freq"        :"ndwell_per_f",
-        "number of midbnmr regions"         :"nregion",
-        "num post RF beamOn dwelltimes"     :"ndwell_post_on",
-
-        "Param X Start"                     :'xstart',
-        "Param X Stop"                      :'xstop',
-        "Param X Incr"                      :'xincr',
-        "Constant param Y"                  :'yconst',
-
-        "f1 frequency function"             :"freqfn_f1",
-        "f2 frequency function"             :"freqfn_f2",
-        "f3 frequency function"             :"freqfn_f3",
-        "f4 frequency function"             :"freqfn_f4",
-
-        "PPG mode"                          :"mode",
-        "e20 prebeam dwelltimes"            :"prebeam",
-        "e00 prebeam dwelltimes"            :"prebeam",
-        "psm onef enabled"                  :"onef_enable",
-        "psm onef scale factor"             :"onef_scale",
-        "psm fREF enabled"                  :"fref_enable",
-        "psm fREF scale factor"             :"fref_scale",
-        "psm scale factor"                  :"psm_scale",
-        "psm scaler factor"                 :"psm_scale",
-
-        "randomize freq increments"         :"rand_freq_incr",
-        "Randomize freq values"             :"rand_freq_val",
-        "Ref tuning freq (Hz)"              :"ref_tune_freq",
-        "Ref tuning frequency (Hz)"         :"ref_tune_freq",
-        "e20 rf frequency (Hz)"             :"freq",
-        "e00 rf frequency (Hz)"             :"freq",
-        "RFon delay (dwelltimes)"           :"rf_on_delay",
-        "num RF on delays (dwell times)"    :"rf_on_delay",
-        "RFon duration (dwelltimes)"        :"rf_on",
-        "RF on time (ms)"                   :"rf_on_ms",
-        "RF enabled"                        :"rf_enable",
-
-        'num finer freq regions'            :'fine_freq_nregions',
-        'fine freq start  (hz)'             :'fine_freq_start',
-        'fine freq end  (hz)'               :'fine_freq_end',
-        'fine freq increment  (hz)'         :'fine_freq_increment',
-
-        "Single tone simulated"             :"sgle_tone_sim",
-
-        "use defaults for midbnmr"          :"defaults",
-
-        "probe species"                     :"probe_species",
-    }
+            'atag'                  :'alpha_tagged',
+            'at'                    :'alpha_tagged',
 
-    # CAMP
-    dkeys_camp = {
-
-        "/biasV/input1"                             :"rb_cell_bias_set",
-        "/biasV/output1"                            :"rb_cell_bias_read",
-
-        "/CryoEx_MassFlow/read_flow"                :"cryo_read",
-        "/CryoEx_MassFlow/set_flow"                 :"cryo_set",
-        "/Cryo_level/He_level"                      :"cryo_he",
-        "/Cryo_level/N2_level"                      :"cryo_n2",
-        "/cryo_lift/set_position"                   :"clift_set",
-        "/cryo_lift/read_position"                  :"clift_read",
-
-        "/Cryo_oven/current_read_1"                 :"oven_current",
-        "/Cryo_oven/output_1/D"                     :"oven_out_d",
-        "/Cryo_oven/output_1/I"                     :"oven_out_i",
-        "/Cryo_oven/output_1/P"                     :"oven_out_p",
-        "/Cryo_oven/read_A"                         :"oven_readA",
-        "/Cryo_oven/read_B"                         :"oven_readB",
-        "/Cryo_oven/read_C"                         :"oven_readC",
-        "/Cryo_oven/read_D"                         :"oven_readD",
-        "/Cryo_oven/setpoint_1"                     :"oven_set1",
-
-        "/Dac0/dac_set"                             :"dac_set",
-        "/dac/dac_set"                              :"dac_set",
-        "/Dewar/He_level"                           :"he_level",
-
-        "/flow_set/output"                          :"flow_set_out",
-
-        "/He_flow/read_flow"                        :"he_read",
-        "/He_flow/set_flow"                         :"he_set",
-
-        "/lock-in/R"                                :"lockin_r",
-        "/lock-in/theta"                            :"lockin_theta",
-        "/lock-in/X"                                :"lockin_x",
-        "/lock-in/Y"                                :"lockin_y",
-
-        "/Magnet/mag_field"                         :"b_field",
-        "/Magnet/mag_set"                           :"b_field_setpt",
-        "/Magnet/mag_read"                          :"mag_current",
-        "/Magnet/controls/sys_status"               :"mag_ctrl_status",
-        "/Magnet/ramp_status"                       :"mag_ramp_status",
-        "/Magnet/volts"                             :"mag_voltage",
-        "/mass_flow/read_flow"                      :"mass_read",
-        "/mass_flow/set_flow"                       :"mass_set",
-
-        "/needle-valve/read_position"               :"needle_read",
-        "/Needle/read_position"                     :"needle_pos",
-        "/Needle/motor_position"                    :"needle_pos",
-        "/needle-valve/set_position"                :"needle_set",
-        "/Needle_Valve/set_position"                :"needle_set",
-        "/Needle/set_position"                      :"needle_set",
-
-        "/PVac/adc_read"                            :"vac",
-
-        "/rfamp/fwd_max"                            :"rfamp_fwd",
-        "/rfamp/fwd_power"                          :"rfamp_fpwr",
-        "/rfamp/refl_max"                           :"rfamp_rfl",
-        "/rfamp/RF_gain"                            :"rfamp_rfgain",
-        "/rf_level_cont/dac_set"                    :"rf_dac",
-
-        "/Sample/current_read_1"                    :"smpl_current",
-        "/Sample/current_read"                      :"smpl_current",
-        "/Sample1/current_read"                     :"smpl_current",
-        "/Sample/sample_read"                       :"smpl_read_A",
-        "/Sample/read_A"                            :"smpl_read_A",
-        "/Sample1/read_A"                           :"smpl_read_A",
-        "/Sample/read_B"                            :"smpl_read_B",
-        "/Sample1/read_B"                           :"smpl_read_B",
-        "/adc0/adc_read"                            :"smpl_read_B",
-        "/Sample/read_C"                            :"smpl_read_C",
-        "/Sample/read_D"                            :"smpl_read_D",
-        "/Sample/set_current"                       :"smpl_set_current",
-        "/Sample/setpoint"                          :"smpl_set",
-        "/Sample1/setpoint"                         :"smpl_set",
-        "/Sample/setpoint_1"                        :"smpl_set",
-        "/sample2/heat_range"                       :"smpl2_heat",
-        "/sample2/sample_read"                      :"smpl2_read",
-        "/sample_volts/reading"                     :"smpl_volts",
-        "/Shield/read_1"                            :"shield_read1",
-        "/signal_gen/amplitude"                     :"sig_gen_amp",
-        "/signal_gen/frequency"                     :"sig_gen_freq",
-        "/signal_gen/power_level"                   :"sig_gen_pwr",
-        "/signal_gen/rf_on"                         :"sig_gen_rfon",
-        "/stealth/fwd_max"                          :"stealth_fwd_max",
-        "/stealth/fwd_power"                        :"stealth_fwd_pwr",
-        "/stealth/rev_max"                          :"stealth_rev_max",
-        "/stealth/rev_power"                        :"stealth_rev_pwr",
-    }
+            'b'                     :'backward_counter',
+            'bck'                   :'backward_counter',
+            'left'                  :'backward_counter',
+            'left_counter'          :'backward_counter',
 
-    # EPICS
-    dkeys_epics = {
-        "BNMR:HVBIAS:P"                             :"nmr_bias",
-        "BNMR:HVBIAS:PO"                            :"nmr_bias",
-        "BNMR:HVBIAS:POS"                           :"nmr_bias",
-        "BNMR:HVBIAS:POS:"                          :"nmr_bias",
-        "BNMR:HVBIAS:POS:R"                         :"nmr_bias",
-        "BNMR:HVBIAS:POS:RDVO"                      :"nmr_bias",
-        "BNMR:HVBIAS:POS:RDVOL"                     :"nmr_bias",
-        "BNMR:HVBIAS:POS:RDVOL1"                    :"nmr_bias",
-
-        "BNMR:HVBIAS:N"                             :"nmr_bias_n",
-        "BNMR:HVBIAS:NE"                            :"nmr_bias_n",
-        "BNMR:HVBIAS:NEG"                           :"nmr_bias_n",
-        "BNMR:HVBIAS:NEG:"                          :"nmr_bias_n",
-        "BNMR:HVBIAS:NEG:R"                         :"nmr_bias_n",
-        "BNMR:HVBIAS:NEG:RDVO"                      :"nmr_bias_n",
-        "BNMR:HVBIAS:NEG:RDVOL"                     :"nmr_bias_n",
-        "BNMR:HVBIAS:NEG:RDVOL1"                    :"nmr_bias_n",
-
-        "BNQR:HVBIAS:RD"                            :"nqr_bias",
-        "BNQR:HVBIAS:RDVOL"                         :"nqr_bias",
-
-        "ITE:BIAS:RDVO"                             :"target_bias",
-        "ITE:BIAS:RDVOL"                            :"target_bias",
-        "ITE:BIAS:RDVOLER"                          :"target_bias",
-        "ITE:BIAS:RDVOLVOL"                         :"target_bias",
-        "ITW:BIAS:R"                                :"target_bias",
-        "ITW:BIAS:RD"                               :"target_bias",
-        "ITW:BIAS:RDV"                              :"target_bias",
-        "ITW:BIAS:RDVO"                             :"target_bias",
-        "ITW:BIAS:RDVOL"                            :"target_bias",
-        "ITW:BIAS:RDVOL1"                           :"target_bias",
-        "ITW:BIAS:RDVOLVOL"                         :"target_bias",
-
-        "ILE2:BIAS15:R"                             :"bias15",
-        "ILE2:BIAS15:RD"                            :"bias15",
-        "ILE2:BIAS15:RDV"                           :"bias15",
-        "ILE2:BIAS15:RDVO"                          :"bias15",
-        "ILE2:BIAS15:RDVOL"                         :"bias15",
-
-        "ILE2:LAS:RDPO"                             :"las_pwr",
-        "ILE2:LAS:RDPOW"                            :"las_pwr",
-        "ILE2:LAS:RDPOWE"                           :"las_pwr",
-        "ILE2:LAS:RDPOWER"                          :"las_pwr",
-        "ILE2:LAS:RDPOWERL"                         :"las_pwr",
-
-        "ILE2:BIASTUBE:"                            :"biastube",
-        "ILE2:BIASTUBE:V"                           :"biastube",
-        "ILE2:BIASTUBE:VOL"                         :"biastube",
-        "ILE2:BIASTUBE:RDVOL"                       :"biastube",
-
-        "ILE2:DPPLR:CH0:HW:RDVOL"                   :"dopplertube_ch0",
-        "ILE2:DPPLR:CH1:HW:RDVOL"                   :"dopplertube_ch1",
-        "ILE2:DPPLR:CH2:HW:RDVOL"                   :"dopplertube_ch2",
-
-        "BNMR:EL3:RDVOL"                            :"el3",
-
-        "ILE2A1:HH:CUR"                             :"hh_current",
-        "ILE2A1:HH:RDCU"                            :"hh_current",
-        "ILE2A1:HH:RDCUR"                           :"hh_current",
-        "ILE2A1:HH3:RDCUR"                          :"hh_current",
-
-        "ILE2A1:HH6:RDCUR"                          :"hh6_current",
-
-        "TRILIS177:METER:LAMBDA1"                   :"las_lambda",
-        "TRILIS177:METER:WAVENUM1"                  :"las_wavenum",
-    }
+            'c'                     :'combined',
+            'com'                   :'combined',
 
-    dkeys = {"":"", **dkeys_camp, **dkeys_epics, **dkeys_ppg}
+            'cntr'                  :'counter',
 
-    # mapping from old run attributes to new run attributes
-    old_attr = {
-        # histogram names
-            'FREQ'          :'Frequency',
-            'Bp'            :'B+',
-            'back+'         :'B+',
-            'Fp'            :'F+',
-            'front+'        :'F+',
-            'Bm'            :'B-',
-            'back-'         :'B-',
-            'Fm'            :'F-',
-            'front-'        :'F-',
-            'FluM'          :'FluM2',
-            'FluorMon2'     :'FluM2',
-            'PolLp'         :'L+',
-            'PolLeft+'      :'L+',
-            'PolRp'         :'R+',
-            'PolRight+'     :'R+',
-            'PolLm'         :'L-',
-            'PolLeft-'      :'L-',
-            'PolRm'         :'R-',
-            'PolRight-'     :'R-',
-            'NBMBp'         :'NBMB+',
-            'NeutBmB+'      :'NBMB+',
-            'NBMFp'         :'NBMF+',
-            'NeutBmF+'      :'NBMF+',
-            'NBMBm'         :'NBMB-',
-            'NeutBmB-'      :'NBMB-',
-            'NBMFm'         :'NBMF-',
-            'NeutBmF-'      :'NBMF-',
-
-        # method to mode conversion
-            'TI-Bnmr'       :'1f',
-            'TI-bNMR'       :'1f',
-
-            'TD-Bnmr'       :'20',
-            'TD-bNMR'       :'20',
-
-        # apparatus
-            'bnmr2'         :'BNMR',
-            'bnmr'          :'BNMR',
-        }
-
-    # options for asymmetry calculation
-    option = {  ''                      :'',
+            'dif_c'                 :'difference_combined',
+            'dc'                    :'difference_combined',
 
-                'adif'                  :'alpha_diffusion',
-                'ad'                    :'alpha_diffusion',
-                'adiff'                 :'alpha_diffusion',
+            'dif_h'                 :'difference_helicity',
+            'dh'                    :'difference_helicity',
 
-                'atag'                  :'alpha_tagged',
-                'at'                    :'alpha_tagged',
+            'f'                     :'forward_counter',
+            'fwd'                   :'forward_counter',
+            'right'                 :'forward_counter',
+            'right_counter'         :'forward_counter',
 
-                'b'                     :'backward_counter',
-                'bck'                   :'backward_counter',
-                'left'                  :'backward_counter',
-                'left_counter'          :'backward_counter',
+            '+'                     :'positive',
+            'up'                    :'positive',
+            'u'                     :'positive',
+            'p'                     :'positive',
+            'pos'                   :'positive',
 
-                'c'                     :'combined',
-                'com'                   :'combined',
+            '-'                     :'negative',
+            'down'                  :'negative',
+            'd'                     :'negative',
+            'n'                     :'negative',
+            'neg'                   :'negative',
 
-                'cntr'                  :'counter',
+            'h'                     :'helicity',
+            'hel'                   :'helicity',
 
-                'dif_c'                 :'difference_combined',
-                'dc'                    :'difference_combined',
+            'r'                     :'raw',
 
-                'dif_h'                 :'difference_helicity',
-                'dh'                    :'difference_helicity',
+            'rs'                    :'raw_split_scan',
+            'raw_split'             :'raw_split_scan',
 
-                'f'                     :'forward_counter',
-                'fwd'                   :'forward_counter',
-                'right'                 :'forward_counter',
-                'right_counter'         :'forward_counter',
+            'raw_c'                 :'raw_combined',
+            'rc'                    :'raw_combined',
 
-                '+'                     :'positive',
-                'up'                    :'positive',
-                'u'                     :'positive',
-                'p'                     :'positive',
-                'pos'                   :'positive',
+            'raw_h'                 :'raw_helicity',
+            'rh'                    :'raw_helicity',
 
-                '-'                     :'negative',
-                'down'                  :'negative',
-                'd'                     :'negative',
-                'n'                     :'negative',
-                'neg'                   :'negative',
+            'sl_c'                  :'slope_combined',
+            'slc'                   :'slope_combined',
+            'sc'                    :'slope_combined',
 
-                'h'                     :'helicity',
-                'hel'                   :'helicity',
+            'sl_h'                  :'slope_helicity',
+            'slh'                   :'slope_helicity',
+            'sh'                    :'slope_helicity',
+}
+_OPTION = types.MappingProxyType(
+    {sys.intern(k): sys.intern(i) for k, i in _OPTION.items()})
 
-                'r'                     :'raw',
+# output keys for mode TI runs
+_MODE1_DICT = {  '1f': 'freq',
+                '1x': 'freq',
+                '1w': 'xpar',
+                '1n': 'mV',
+                '1e': 'mA',
+                '1c': 'camp',
+                '1d': 'las',
+                }
 
-                'rs'                    :'raw_split_scan',
-                'raw_split'             :'raw_split_scan',
+# =========================================================================== #
+class bdata(mdata):
+    """
+        Class fields
+            dkeys
+            evar_bnmr
+            evar_bnqr
 
-                'raw_c'                 :'raw_combined',
-                'rc'                    :'raw_combined',
+        Data fields
+            slr_bkgd_corr: if true subtract hist prebeam mean from bins (SLR only)
+            slr_rm_prebeam: if true remove prebeam bins from output (SLR only)
+            ppg
+            epics
+            camp
+            + inherited fields from mdata
+    """
 
-                'raw_h'                 :'raw_helicity',
-                'rh'                    :'raw_helicity',
+    # set nice dictionary keys
+    dkeys_ppg = _DKEYS_PPG
+    dkeys_camp = _DKEYS_CAMP
+    dkeys_epics = _DKEYS_EPICS
+    dkeys = _DKEYS
 
-                'sl_c'                  :'slope_combined',
-                'slc'                   :'slope_combined',
-                'sc'                    :'slope_combined',
+    # mapping from old run attributes to new run attributes
+    old_attr = _OLD_ATTR
 
-                'sl_h'                  :'slope_helicity',
-                'slh'                   :'slope_helicity',
-                'sh'                    :'slope_helicity',
-    }
+    # options for asymmetry calculation
+    option = _OPTION
 
     # output keys for mode TI runs
-    mode1_dict = {  '1f': 'freq',
-                    '1x': 'freq',
-                    '1w': 'xpar',
-                    '1n': 'mV',
-                    '1e': 'mA',
-                    '1c': 'camp',
-                    '1d': 'las',
-                    }
+    mode1_dict = _MODE1_DICT
+
+    # asymmetry kinds computed for each 1F option, in output order
+    _OPT_MAP = types.MappingProxyType({
+        '':                 ('p', 'n', 'b', 'f', 'c'),
+        'helicity':         ('p', 'n'),
+        'positive':         ('p', ),
+        'negative':         ('n', ),
+        'counter':          ('b', 'f'),
+        'backward_counter': ('b', ),
+        'forward_counter':  ('f', ),
+        'combined':         ('c', ),
+    })
 
     # set environment variable same to get data archive location
     # should point to something like
@@ -518,11 +716,8 @@ class bdata(mdata):
         if run_number is None and filename == '':
             raise InputError("Bad input, specify either run_number or filename")
 
-        # convert dkeys keys to lower case
-        bdata.dkeys = {k.lower():i for k, i in self.dkeys.items()}
-
         # Get the current year
-        if year is None:   year = datetime.datetime.now().year
+        if year is None:   year = time.localtime().tm_year
 
         # read file if not provided
         if filename == "":
@@ -536,53 +731,34 @@ class bdata(mdata):
                 raise ValueError("Run number out of range")
 
             # look for data location
-            if spect_dir == "bnmr":
-
-                use_default_dir = not self.evar_bnmr in os.environ
-                if use_default_dir:
-                    directory = os.path.join(bd._mud_data, spect_dir)
-                else:
-                    directory = os.environ[self.evar_bnmr]
-
-            elif spect_dir == "bnqr":
-
-                use_default_dir = not self.evar_bnqr in os.environ
-                if use_default_dir:
-                    directory = os.path.join(bd._mud_data, spect_dir)
-                else:
-                    directory = os.environ[self.evar_bnqr]
+            evar = self.evar_bnmr if spect_dir == "bnmr" else self.evar_bnqr
+            directory = _get_data_dir(spect_dir, evar, year)
 
             # finalize file name
             run = '%06d.msr' % run_number
-            filename = os.path.join(directory, str(year), run)
+            filename = os.path.join(directory, run)
+
+            # stat once: on networked archives each filesystem probe is a
+            # round-trip, so learn link/file status from a single lstat
+            try:
+                fstat = os.lstat(filename)
+            except FileNotFoundError:
+                fstat = None
 
             # check if file is link - follow the link
-            if os.path.islink(filename):
+            if fstat is not None and stat.S_ISLNK(fstat.st_mode):
                 path = os.path.split(filename)[0]
                 filename = os.path.split(os.readlink(filename))[-1]
                 filename = os.path.join(path, filename)
 
-            # if file does not exist, try to fetch from web
-            if not os.path.isfile(filename):
-
-                # make directory
-                os.makedirs(os.path.join(directory, str(year)), exist_ok=True)
-
-                # make url
-                url = '/'.join(('http://musr.ca/mud/data',
-                                spect_dir.upper(),
-                                str(year),
-                                run))
-
-                # get data
-                webfile = requests.get(url)
-                if not webfile.ok:
-                    raise RuntimeError('File %s not found. '%filename+\
-                                'Attempted download from musr.ca failed.')
+                try:
+                    fstat = os.lstat(filename)
+                except FileNotFoundError:
+                    fstat = None
 
-                # write to file
-                with open(filename, 'wb') as fid:
-                    fid.write(webfile.content)
+            # if file does not exist, try to fetch from web
+            if fstat is None or not stat.S_ISREG(fstat.st_mode):
+                self._download(spect_dir, run, year, directory)
 
                 # let users know what happened
                 warnings.warn('Run %d (%d) not found '% (run_number, year)+\
@@ -590,13 +766,36 @@ class bdata(mdata):
                               'from musr.ca.',
                               category=IOWarning)
 
+        # optionally reload a previously parsed run from the pickle cache.
+        # opt-in via the BDATA_CACHE environment variable (a writable
+        # directory), since data archives are often read-only network shares
+        cache = None
+        if 'BDATA_CACHE' in os.environ:
+            try:
+                fstat = os.stat(filename)
+                cache_key = (os.path.abspath(filename),
+                             fstat.st_mtime,
+                             fstat.st_size)
+                cache = os.path.join(os.environ['BDATA_CACHE'],
+                                     os.path.basename(filename) + '.pickle')
+
+                with open(cache, 'rb') as fid:
+                    saved_key, state = pickle.load(fid)
+
+                # use the cache only if the source file is unchanged
+                if saved_key == cache_key:
+                    self.__dict__.update(state)
+                    return
+
+            except (OSError, EOFError, pickle.PickleError):
+                pass
+
         # Open and read file
         super().__init__(filename)
 
         # cast histogram data to floats
         if hasattr(self, 'hist'):
-            for key, hist in self.hist.items():
-                self.hist[key].data = hist.data.astype(np.float64)
+            _cast_hists_float64(self.hist)
 
         # Sort independent variables into dictionaries by title
         self.ppg = vdict()
@@ -605,41 +804,54 @@ class bdata(mdata):
 
         if hasattr(self, 'ivar'):
 
+            # partition the variables by kind with cheap prefix tests only,
+            # then run one specialized loop per kind
+            ppg_vars = []
+            camp_vars = []
+            epics_vars = []
+            unknown = []
+
             for v in self.ivar.values():
-                if 'PPG' in v.title:
-                    title = v.title.split("/")[-1].lower()
-                    title_default = re.sub(r'\W', '', title.replace(' ', '_'))
-
-                    # check for 1x mode keys
-                    if title not in bdata.dkeys.keys():
-
-                        title_1x = re.sub('[0-9]', '', title)
-                        if title_1x in bdata.dkeys.keys():
-                            new_title = bdata.dkeys[title_1x]
-
-                            try:
-                                num = re.search(r'\d+', title).group()
-                            except AttributeError:
-                                self.ppg[bdata.dkeys.get(title, title_default)] = v
-                                continue
-
-                            new_title += '_%s' % num
-                            self.ppg[new_title] = v
-                            continue
-
-                    self.ppg[bdata.dkeys.get(title, title_default)] = v
-                elif v.title == "":
-                    pass
-                elif v.title[0] == "/":
-                    title = v.title.lower()
-                    title_default = re.sub(r'\W', '', title.replace(' ', '_'))
-                    self.camp[bdata.dkeys.get(title, title_default)] = v
+                title = v.title
+
+                if not title:
+                    continue
+                elif 'PPG' in title:
+                    ppg_vars.append(v)
+                elif title[0] == "/":
+                    camp_vars.append(v)
                 else:
-                    title = v.title.lower()
-                    title_default = re.sub(r'\W', '', title.replace(' ', '_'))
-                    self.epics[bdata.dkeys.get(title, title_default)] = v
-
-                if title not in bdata.dkeys.keys() and 'fine freq' not in title:
+                    epics_vars.append(v)
+
+            dkeys = _DKEYS
+            ppg = self.ppg
+            camp = self.camp
+            epics = self.epics
+
+            for v in ppg_vars:
+                title = v.title.split("/")[-1].lower()
+                key, known = _get_ppg_key(title)
+                ppg[key] = v
+                if not known and 'fine freq' not in title:
+                    unknown.append(v)
+
+            for v in camp_vars:
+                title = v.title.lower()
+                key = dkeys.get(title)
+                camp[key or _default_title(title)] = v
+                if key is None and 'fine freq' not in title:
+                    unknown.append(v)
+
+            for v in epics_vars:
+                title = v.title.lower()
+                key = dkeys.get(title)
+                epics[key or _default_title(title)] = v
+                if key is None and 'fine freq' not in title:
+                    unknown.append(v)
+
+            # skip the message formatting entirely when the warning is muted
+            if unknown and not _dkey_warnings_ignored():
+                for v in unknown:
                     message = '%d.%d: "%s" not found in dkeys ("%s").'
                     message = message % (self.year, self.run, v.title, v.description)
                     warnings.warn(message, DkeyWarning, stacklevel=2)
@@ -653,10 +865,10 @@ class bdata(mdata):
             # histogram titles
             hist = hdict()
 
-            for k in self.hist.keys():
+            for k, v in self.hist.items():
                 newk = self.old_attr.get(k, k)
-                hist[newk] = self.hist[k]
-                hist[newk].title = newk
+                v.title = newk
+                hist[newk] = v
             self.hist = hist
 
         # Fix inconsistent area for old runs
@@ -664,10 +876,33 @@ class bdata(mdata):
             if self.run >= 45000:   self.area = 'BNQR'
             else:                   self.area = 'BNMR'
 
+        # cache area comparisons used on the asymmetry paths
+        self._set_area_flags()
+
+        # flat index of second-level attribute names to their owning
+        # container, so __getattr__ is a single hash lookup rather than a
+        # failed probe of each container in turn
+        attr_index = {}
+        for src in (self.camp, self.epics, self.ppg,
+                    getattr(self, 'hist', {})):
+            for k in src:
+                attr_index.setdefault(k, src)
+        self._attr_index = attr_index
+
         # some defaults
         self.slr_bkgd_corr = True
         self.slr_rm_prebeam = True
 
+        # save to the pickle cache for fast re-opens. protocol 5 writes the
+        # histogram arrays as raw buffers, so a warm open skips the MUD parse
+        if cache is not None:
+            try:
+                os.makedirs(os.path.dirname(cache), exist_ok=True)
+                with open(cache, 'wb') as fid:
+                    pickle.dump((cache_key, self.__dict__), fid, protocol=5)
+            except OSError:
+                pass
+
     # ======================================================================= #
     def __add__(self, other):
         """
@@ -696,27 +931,47 @@ class bdata(mdata):
     # ======================================================================= #
     def __getattr__(self, name):
 
-        if name in ('hist', 'camp', 'ppg', 'epics'):
-            return getattr(object, name)
+        # reaching here means normal lookup failed: the container names
+        # themselves are never fetched from second level
+        d = self.__dict__
 
-        else:
+        if name not in ('hist', 'camp', 'ppg', 'epics'):
 
-            # fetch from top level
-            try:
-                return getattr(object, name)
+            index = d.get('_attr_index')
+
+            # fast path: flat index built in __init__
+            src = index.get(name) if index is not None else None
+
+            # keys can be added to the containers after construction:
+            # reprobe them and keep the index current
+            if src is None:
+                for cname in ('camp', 'epics', 'ppg', 'hist'):
+                    container = d.get(cname)
+                    if container is not None and name in container:
+                        if index is not None:
+                            index[name] = container
+                        src = container
+                        break
+
+            if src is not None:
+                return getattr(src, name)
 
-            # fetching of second level
-            except AttributeError as err:
-                if hasattr(self, 'camp') and hasattr(self.camp, name):
-                    return getattr(self.camp, name)
-                if hasattr(self, 'epics') and hasattr(self.epics, name):
-                    return getattr(self.epics, name)
-                if hasattr(self, 'ppg') and hasattr(self.ppg, name):
-                    return getattr(self.ppg, name)
-                if hasattr(self, 'hist') and hasattr(self.hist, name):
-                    return getattr(self.hist, name)
+            # on an exact-key miss, defer to the containers' own getattr:
+            # mdict also resolves names by swapping p/n for +/-, so that
+            # run.Fp reaches hist['F+']
+            for cname in ('camp', 'epics', 'ppg', 'hist'):
+                container = d.get(cname)
+                if container is not None:
+                    try:
+                        value = getattr(container, name)
+                    except AttributeError:
+                        continue
 
-                raise AttributeError(err) from None
+                    if index is not None:
+                        index[name] = container
+                    return value
+
+        raise AttributeError(name)
 
     # ======================================================================= #
     def __repr__(self):
@@ -735,32 +990,36 @@ class bdata(mdata):
         except AttributeError:
             pass
 
-        dkeys = list(d.keys())
-        if dkeys:
+        if d:
+
+            # single sorted pass: collect items in print order and track the
+            # width of the longest printed key as we go
             items = []
-            dkeys.sort()
-            for key in dkeys:
-                if key[0] == '_': continue
+            m = 0
+            for key, val in sorted(d.items()):
+                if key.startswith('_'): continue
 
                 # exceptions
                 if key in ('ivar', 'sclr'):
-                    items.append([key, d[key].__class__])
+                    items.append([key, val.__class__])
 
                 # non iterables and mdict objects
-                elif not hasattr(d[key], '__iter__') or d[key].__class__ in (mdict, vdict, hdict):
-                    items.append([key, d[key]])
+                elif not hasattr(val, '__iter__') or val.__class__ in (mdict, vdict, hdict):
+                    items.append([key, val])
 
                 # strings
-                elif d[key].__class__ in (str, np.str_):
-                    items.append([key, d[key]])
+                elif val.__class__ in (str, np.str_):
+                    items.append([key, val])
 
                 # misc objects
                 else:
-                    items.append([key, d[key].__class__])
+                    items.append([key, val.__class__])
 
+                if len(key) > m:
+                    m = len(key)
 
-            m = max(map(len, dkeys)) + 1
-            s = '\n'.join([k.rjust(m)+': '+repr(v) for k, v in sorted(items)])
+            m += 1
+            s = '\n'.join([k.rjust(m)+': '+repr(v) for k, v in items])
             return s
         else:
             return self.__class__.__name__ + "()"
@@ -788,15 +1047,16 @@ class bdata(mdata):
         bias15 = getattr(epics.bias15, attr)/1000.
 
         # get platform bias
-        if self.area.upper() == 'BNMR':
+        if self._is_bnmr:
             platform = getattr(epics.nmr_bias, attr)
-        elif self.area.upper() == 'BNQR':
+        elif self._is_bnqr:
             platform = getattr(epics.nqr_bias, attr)/1000.
         else:
             raise RuntimeError('Area not recognized')
 
         if get_error:
-            return np.sqrt(np.sum(np.square((beam, bias15, platform)))) # keV
+            # scalar math: no need to round-trip three floats through numpy
+            return math.sqrt(beam*beam + bias15*bias15 + platform*platform) # keV
         else:
             return beam-bias15-platform # keV
 
@@ -808,6 +1068,9 @@ class bdata(mdata):
             2 = neg helicity
         """
 
+        # import here: iminuit is slow to load and most sessions never fit
+        from iminuit import Minuit
+
         # parse input
         scan_comb_fn, \
         baseline_bins, \
@@ -837,9 +1100,11 @@ class bdata(mdata):
 
                     for top, bot, fq in zip(num, den, fre):
 
-                        # get ratio
-                        bot[bot==0] = np.nan
-                        top[top==0] = np.nan
+                        # get ratio. rebinding rather than writing in
+                        # place: the inputs are views of counters the
+                        # asym deadtime cache shares between calls
+                        bot = np.where(bot == 0, np.nan, bot)
+                        top = np.where(top == 0, np.nan, top)
                         r = top/bot
                         dr = r * np.sqrt(1/top + 1/bot)
 
@@ -853,18 +1118,23 @@ class bdata(mdata):
                 slope1, ratio1 = get_slopes(B1_spl, F1_spl, freq1_spl)
                 slope2, ratio2 = get_slopes(F2_spl, B2_spl, freq2_spl)
 
+                # the frequency offsets are invariant across minimizer
+                # iterations: compute them once outside do_correction
+                delta1 = [np.mean(fq) - fq for fq in freq1_spl]
+                delta2 = [np.mean(fq) - fq for fq in freq2_spl]
+
                 # do correction
                 def do_correction(factor=1):
 
                     # fix the numerator counter to get the correct resulting ratio
                     B1_fix = []
-                    for r, sl, f, fq in zip(ratio1, slope1, F1_spl, freq1_spl):
-                        g = r + factor*sl*(np.mean(fq) - fq)
+                    for r, sl, f, dl in zip(ratio1, slope1, F1_spl, delta1):
+                        g = r + factor*sl*dl
                         B1_fix.append(g * f)
 
                     F2_fix = []
-                    for r, sl, b, fq in zip(ratio2, slope2, B2_spl, freq2_spl):
-                        g = r + factor*sl*(np.mean(fq) - fq)
+                    for r, sl, b, dl in zip(ratio2, slope2, B2_spl, delta2):
+                        g = r + factor*sl*dl
                         F2_fix.append(g * b)
 
                     # concat
@@ -955,6 +1225,9 @@ class bdata(mdata):
             d = list: [1+ 1- 2+ 2-], where 1 = F/R and 2 = B/L
         """
 
+        # import here: iminuit is slow to load and most sessions never fit
+        from iminuit import Minuit
+
         # parse input
         scan_comb_fn, \
         baseline_bins, \
@@ -986,17 +1259,45 @@ class bdata(mdata):
                     slopes.append(sl)
                     asym.append(a)
 
+                # the frequency offsets are invariant across minimizer
+                # iterations: compute them once outside do_correction
+                deltas = [np.mean(fq) - fq for fq in freq_spl]
+
+                # preallocate the combined buffers: do_correction may run once
+                # per minimizer iteration and the scan layout never changes.
+                # the raw (split_scan) output needs per-scan lists, so only
+                # the combined paths use them
+                if not split_scan:
+                    offsets = np.concatenate(
+                        ([0], np.cumsum([len(b) for b in B_spl]))).astype(int)
+                    F_buf = np.empty(offsets[-1])
+                    B_cat = np.concatenate(B_spl)
+                    freq_cat = np.concatenate(freq_spl)
+
                 # do correction
                 def do_correction(factor=1):
                     # fix the forward counter to get the correct resulting ratio
-                    F_spl2 = []
-                    for a, sl, f, b, fq in zip(asym, slopes, F_spl, B_spl, freq_spl):
-                        g = a + factor*sl*(np.mean(fq) - fq)
-                        g[g == 1] = np.nan
-                        F_spl2.append((1+g)/(1-g) * b)
+                    if split_scan:
+                        F_spl2 = []
+                        for a, sl, b, dl in zip(asym, slopes, B_spl, deltas):
+                            g = a + factor*sl*dl
+                            g[g == 1] = np.nan
+                            F_spl2.append((1+g)/(1-g) * b)
 
-                    # combine
-                    freq, (F, B) = scan_comb_fn([F_spl2, B_spl], freq_spl)
+                        # combine
+                        freq, (F, B) = scan_comb_fn([F_spl2, B_spl], freq_spl)
+
+                    else:
+                        for a, sl, b, dl, start, stop in zip(
+                                asym, slopes, B_spl, deltas,
+                                offsets[:-1], offsets[1:]):
+                            g = a + factor*sl*dl
+                            g[g == 1] = np.nan
+                            F_buf[start:stop] = (1+g)/(1-g) * b
+
+                        # combine: the scan functions concatenate lists, and
+                        # pass pre-joined arrays through unchanged
+                        freq, (F, B) = scan_comb_fn([F_buf, B_cat], freq_cat)
 
                     # get asym
                     if type(F) is list:
@@ -1073,23 +1374,24 @@ class bdata(mdata):
             deadtime:   float
         """
 
+        ppg = self.ppg
         try:
 
             # dwell time
-            tdwell = self.ppg['dwelltime'].mean * 0.001
+            tdwell = ppg['dwelltime'].mean * 0.001
 
             # time to do one scan
             if self.mode in ('20', '2h', '00'):
-                tscan = tdwell * (self.ppg['beam_on'].mean + \
-                                  self.ppg['beam_off'].mean + \
-                                  self.ppg['prebeam'].mean) \
-                        + self.ppg['hel_sleep'].mean * 0.001
+                tscan = tdwell * (ppg['beam_on'].mean + \
+                                  ppg['beam_off'].mean + \
+                                  ppg['prebeam'].mean) \
+                        + ppg['hel_sleep'].mean * 0.001
 
                 # number of scans
                 nscans = self.duration / tscan
 
             elif '1' in self.mode:
-                nscans = self.ppg['nbins'].mean
+                nscans = ppg['nbins'].mean
 
         # missing PPG parameters
         except KeyError:
@@ -1103,16 +1405,56 @@ class bdata(mdata):
         # time per bin
         tbin = tdwell * nscans
 
-        # apply correction
-        dnew = [di / (1 - di/tbin*deadtime) for di in d]
+        # apply correction: one fused pass over all counters at once
+        arr = np.asarray(d, dtype=np.float64)
+        denom = 1.0 - arr*(deadtime/tbin)
+        np.divide(arr, denom, out=denom)
 
-        return dnew
+        return list(denom)
 
     # ======================================================================= #
-    def _get_area_data(self, nbm=False, hist_select=''):
+    @classmethod
+    def _download(cls, spect_dir, run, year, directory, session=requests):
+        """
+            Fetch a single msr file from musr.ca and save it to directory.
+
+            spect_dir:  "bnmr" or "bnqr"
+            run:        file name, ex: 040123.msr
+            year:       int, year of run
+            directory:  path to save file in
+            session:    requests module or Session for connection reuse
+        """
+
+        # make directory
+        os.makedirs(directory, exist_ok=True)
+
+        # make url
+        url = '/'.join(('http://musr.ca/mud/data',
+                        spect_dir.upper(),
+                        str(year),
+                        run))
+
+        filename = os.path.join(directory, run)
+
+        # get data, streaming chunks straight to disk so peak memory
+        # is one chunk rather than the whole file
+        with session.get(url, stream=True, timeout=30) as webfile:
+            if not webfile.ok:
+                raise RuntimeError('File %s not found. '%filename+\
+                            'Attempted download from musr.ca failed.')
+
+            # write to file
+            with open(filename, 'wb') as fid:
+                for chunk in webfile.iter_content(chunk_size=2**20):
+                    fid.write(chunk)
+
+    # ======================================================================= #
+    def _get_area_data(self, nbm=False, hist_select='', copy=True):
         """Get histogram list based on area type.
 
         nbm: if True, get neutral beam monitor data
+        copy: if False, return the stored histogram arrays themselves;
+              callers must not modify them
         hist_select: string of [,], [ ], [;], or [.] deliminated histogram titles
               expected order:   'F+, F-, B+, B-'
               or                'R+, R-, L+, L-'
@@ -1128,12 +1470,9 @@ class bdata(mdata):
         # get histogram titles
         if hist_select != '':
 
-            # replace deliminators with spaces
-            for delim in ', ;.':
-                hist_select = hist_select.replace(delim, ' ')
-
-            # split into parts
-            hist_select = [h.stip() for h in hist_select.split(' ') if h]
+            # replace deliminators with spaces in one pass, then split.
+            # split() without arguments also strips the pieces
+            hist_select = hist_select.translate(_HIST_DELIM_TABLE).split()
 
             # check for user error
             if len(hist_select) < 4:
@@ -1144,10 +1483,10 @@ class bdata(mdata):
         elif nbm:
             hist_select = ('NBMF+', 'NBMF-', 'NBMB+', 'NBMB-')
 
-        elif self.area.upper() == 'BNMR':
+        elif self._is_bnmr:
             hist_select = ('F+', 'F-', 'B+', 'B-')
 
-        elif self.area.upper() == 'BNQR':
+        elif self._is_bnqr:
             hist_select = ['R+', 'R-', 'L+', 'L-']
 
             if self.mode == '2h':
@@ -1161,7 +1500,10 @@ class bdata(mdata):
                                                         (self.year, self.run))
 
         # get data
-        return [np.copy(self.hist[h].data) for h in hist_select]
+        if copy:
+            return [np.copy(self.hist[h].data) for h in hist_select]
+
+        return [self.hist[h].data for h in hist_select]
 
     # ======================================================================= #
     def _get_asym_alpha(self, d_alpha, d_beta):
@@ -1192,14 +1534,12 @@ class bdata(mdata):
             # error with background corrected
             da = asy.get_alpha_err_bkgd(d_alpha, d_beta, n_prebeam)
 
-            # background correction
-            for i in range(len(d_beta)):
-                d_beta[i] -= d_beta[i][:n_prebeam].mean()
-                d_beta[i][d_beta[i] < 0] = 0
-
-            for i in range(len(d_alpha)):
-                d_alpha[i] -= d_alpha[i][:n_prebeam].mean()
-                d_alpha[i][d_alpha[i] < 0] = 0
+            # background correction, rebinding rather than writing in place
+            # so the caller's arrays are never corrected twice
+            d_beta = [np.maximum(di - di[:n_prebeam].mean(), 0)
+                      for di in d_beta]
+            d_alpha = [np.maximum(di - di[:n_prebeam].mean(), 0)
+                       for di in d_alpha]
 
         # get error no background corrections
         else:
@@ -1252,14 +1592,12 @@ class bdata(mdata):
             d = list: [1+ 1- 2+ 2-], where 1 = F/R and 2 = B/L
         """
 
-        # get the relevant counters
-        F = np.copy(d[2])
-        B = np.copy(d[3])
-
+        # get the relevant counters as views: neither path writes to its
+        # inputs, _get_asym_slr copies internally before correcting
         if '1' in self.mode:
-            return self._correct_baseline_simple(freq, F, B, options)
+            return self._correct_baseline_simple(freq, d[2], d[3], options)
         elif '2' in self.mode:
-            return self._get_asym_slr([F, B], simple=True)
+            return self._get_asym_slr([d[2], d[3]], simple=True)
 
     # ======================================================================= #
     def _get_asym_comb(self, d, freq=None, options=''):
@@ -1299,14 +1637,12 @@ class bdata(mdata):
             d = list: [1+ 1- 2+ 2-], where 1 = F/R and 2 = B/L
         """
 
-        # get the relevant counters
-        F = np.copy(d[0])
-        B = np.copy(d[1])
-
+        # get the relevant counters as views: neither path writes to its
+        # inputs, _get_asym_slr copies internally before correcting
         if '1' in self.mode:
-            return self._correct_baseline_simple(freq, F, B, options)
+            return self._correct_baseline_simple(freq, d[0], d[1], options)
         elif '2' in self.mode:
-            return self._get_asym_slr([F, B], simple=True)
+            return self._get_asym_slr([d[0], d[1]], simple=True)
 
     # ======================================================================= #
     def _get_asym_hel(self, d):
@@ -1331,14 +1667,12 @@ class bdata(mdata):
             d = list: [1+ 1- 2+ 2-], where 1 = F/R and 2 = B/L
         """
 
-        # get the relevant counters
-        F = np.copy(d[1])
-        B = np.copy(d[3])
-
+        # get the relevant counters as views: neither path writes to its
+        # inputs, _get_asym_slr copies internally before correcting
         if '1' in self.mode:
-            return self._correct_baseline_simple(freq, F, B, options)
+            return self._correct_baseline_simple(freq, d[1], d[3], options)
         elif '2' in self.mode:
-            return self._get_asym_slr([F, B], simple=True)
+            return self._get_asym_slr([d[1], d[3]], simple=True)
 
     # ======================================================================= #
     def _get_asym_pos(self, d, freq=None, options=''):
@@ -1347,14 +1681,12 @@ class bdata(mdata):
             d = list: [1+ 1- 2+ 2-], where 1 = F/R and 2 = B/L
         """
 
-        # get the relevant counters
-        F = np.copy(d[0])
-        B = np.copy(d[2])
-
+        # get the relevant counters as views: neither path writes to its
+        # inputs, _get_asym_slr copies internally before correcting
         if '1' in self.mode:
-            return self._correct_baseline_simple(freq, F, B, options)
+            return self._correct_baseline_simple(freq, d[0], d[2], options)
         elif '2' in self.mode:
-            return self._get_asym_slr([F, B], simple=True)
+            return self._get_asym_slr([d[0], d[2]], simple=True)
 
     # ======================================================================= #
     def _get_asym_slr(self, d, simple):
@@ -1393,10 +1725,9 @@ class bdata(mdata):
             # error with background corrected
             da = asym_fn_err_bkgd(*d, n_prebeam)
 
-            # background correction
-            for i in range(len(d)):
-                d[i] -= d[i][:n_prebeam].mean()
-                d[i][d[i] < 0] = 0
+            # background correction, rebinding rather than writing in place
+            # so the caller's arrays are never corrected twice
+            d = [np.maximum(di - di[:n_prebeam].mean(), 0) for di in d]
 
         # get error no background corrections
         else:
@@ -1432,14 +1763,11 @@ class bdata(mdata):
         if baseline_bins <= 0:
             return scan
 
-        # get indices to crop
-        bins = np.arange(len(freq))
-
         # sort freq and scan by freq
         idx = np.argsort(freq)
-        freq = np.array(freq)[idx]
-        scan = np.array(scan)[idx]
-        dscan = np.array(dscan)[idx]
+        freq = np.asarray(freq)[idx]
+        scan = np.asarray(scan)[idx]
+        dscan = np.asarray(dscan)[idx]
 
         # crop out center
         low = baseline_bins
@@ -1458,24 +1786,24 @@ class bdata(mdata):
         if not scan2.size:
             return 0
 
-        # estimate starting baseline parameters
-        s_start = np.mean(scan[:low])
-        s_end = np.mean(scan[high:])
-        f_start = np.mean(freq[:low])
-        f_end = np.mean(freq[high:])
+        # fit: the model is a straight line, so use the closed-form weighted
+        # least squares solution rather than an iterative optimizer
+        w = 1/np.square(dscan2)
+
+        s_w = np.sum(w)
+        s_x = np.sum(w*freq2)
+        s_y = np.sum(w*scan2)
+        s_xx = np.sum(w*freq2*freq2)
+        s_xy = np.sum(w*freq2*scan2)
 
-        slope = (s_end - s_start)/(f_end - f_start)
-        offset = s_start - slope * f_start
+        delta = s_w*s_xx - s_x*s_x
 
-        # fit
-        fitfn = lambda x, a, b: a*x + b
-        par, cov = curve_fit(fitfn, freq2, scan2, sigma=dscan2,
-                             absolute_sigma=True,
-                             p0=[slope, offset])
-        std = np.diag(cov)**0.5
+        # degenerate baseline: all points at one frequency
+        if delta == 0:
+            return 0
 
         # baseline slope
-        return par[0]
+        return (s_w*s_xy - s_x*s_y)/delta
 
     # ======================================================================= #
     def _get_1f_mean_scans(self, d, freq):
@@ -1491,17 +1819,32 @@ class bdata(mdata):
         except ValueError:
             pass
 
-        # make data frame
-        df = pd.DataFrame({i:d[i] for i in range(len(d))})
-        df['x'] = freq
+        # group the bins by frequency: integer codes into the unique values
+        x, inv = np.unique(freq, return_inverse=True)
+        nbin = len(x)
+
+        out = np.empty((len(d), nbin))
 
-        # combine scans: values with same frequency
-        df = df.groupby('x').apply(lambda i: i[i>0].mean())
-        df.drop('x', axis='columns', inplace=True)
-        x = df.index.values
-        d = df.values.T
+        # single complete scan: every frequency appears once, so combining
+        # is just a reorder into frequency order
+        if nbin == len(freq):
+            for i, col in enumerate(d):
+                col = np.asarray(col)
+                out[i, inv] = np.where(col > 0, col, np.nan)
 
-        return (x, d)
+            return (x, out)
+
+        # mean of the positive counts at each frequency, nan where none
+        for i, col in enumerate(d):
+            col = np.asarray(col)
+            pos = col > 0
+            sums = np.bincount(inv, weights=np.where(pos, col, 0.),
+                               minlength=nbin)
+            cnts = np.bincount(inv, weights=pos.astype(float),
+                               minlength=nbin)
+            out[i] = sums / np.where(cnts > 0, cnts, np.nan)
+
+        return (x, out)
 
     # ======================================================================= #
     def _get_1f_sum_scans(self, d, freq):
@@ -1517,16 +1860,28 @@ class bdata(mdata):
         except ValueError:
             pass
 
-        # make data frame
-        df = pd.DataFrame({i:d[i] for i in range(len(d))})
-        df['x'] = freq
+        # combine scans: sum values with the same frequency
+        x, inv = np.unique(freq, return_inverse=True)
+        nbin = len(x)
+
+        out = np.empty((len(d), nbin))
+
+        # nan marks bins excluded by the baseline correction: the pandas
+        # groupby sum this replaced skipped them, so sum them as zero
+        d = [np.where(np.isnan(col), 0., col) for col in d]
 
-        # combine scans: values with same frequency
-        df = df.groupby('x').sum()
-        x = df.index.values
-        d = df.values.T
+        # single complete scan: every frequency appears once, so combining
+        # is just a reorder into frequency order
+        if nbin == len(freq):
+            for i, col in enumerate(d):
+                out[i, inv] = col
 
-        return (x, d)
+            return (x, out)
+
+        for i, col in enumerate(d):
+            out[i] = np.bincount(inv, weights=col, minlength=nbin)
+
+        return (x, out)
 
     # ======================================================================= #
     def _get_2e_asym(self):
@@ -1536,27 +1891,28 @@ class bdata(mdata):
         """
 
         # get needed PPG parameters for splitting 1D histos into 2D histos
+        p = self._get_ppg
         try:
             # get frequency vector
-            freq = np.arange(self._get_ppg('freq_start'), \
-                        self._get_ppg('freq_stop')+self._get_ppg('freq_incr'), \
-                        self._get_ppg('freq_incr'))
+            freq_incr = p('freq_incr')
+            freq = np.arange(p('freq_start'), p('freq_stop')+freq_incr,
+                             freq_incr)
 
             # number of dwelltimes per frequency bin
-            ndwell = 2*int(self._get_ppg('ndwell_per_f'))-1
+            ndwell = 2*int(p('ndwell_per_f'))-1
 
             # number of RF on delays for the start bin.
-            start_bin = int(self._get_ppg('rf_on_delay'))
+            start_bin = int(p('rf_on_delay'))
 
             # get bin centers in ms
-            time = self._get_ppg('rf_on_ms')*(np.arange(ndwell)+0.5-ndwell/2.)
+            time = p('rf_on_ms')*(np.arange(ndwell)+0.5-ndwell/2.)
 
             # get the time and index of the middle time
             mid_time_i = int(np.floor(ndwell/2.))
             mid_time = time[mid_time_i]
 
             # beam off time after pulse in ms
-            beam_off = int(self._get_ppg('beam_off_ms'))
+            beam_off = int(p('beam_off_ms'))
 
         except KeyError:
             raise RuntimeError("Not all dictionary variables read out to "+\
@@ -1568,68 +1924,63 @@ class bdata(mdata):
         out['time'] = time
 
         # get data
-        data = np.array(self._get_area_data()) # [[fp], [fm], [bp], [bm]]
+        data = np.array(self._get_area_data(copy=False)) # [[fp], [fm], [bp], [bm]]
 
         # discared initial bad bins, and beam-off trailing bins
         data = data[:, start_bin:len(freq)*ndwell+start_bin]
 
-        # split data by frequency
-        nsplit = len(data[0])/ndwell
-
-        fp = np.array(np.split(data[0], nsplit))
-        fm = np.array(np.split(data[1], nsplit))
-        bp = np.array(np.split(data[2], nsplit))
-        bm = np.array(np.split(data[3], nsplit))
-
-        # get raw asymmetries
-        asym_p_2cntr = (bp-fp)/(bp+fp)      # two counter
-        asym_m_2cntr = (bm-fm)/(bm+fm)      # two counter
-        r = np.sqrt(bp*fm/(bm*fp))
-        asym_4cntr = (r-1)/(r+1)            # four counter
+        # split data by frequency: a view, since the slice above makes the
+        # bin count an exact multiple of ndwell
+        nsplit = data.shape[1] // ndwell
+        fp, fm, bp, bm = data.reshape(4, nsplit, ndwell)
 
-        # get raw asymmetry errors
-        asym_p_2cntr_err = 2*np.sqrt(bp*fp)/((bp+fp)**1.5)
-        asym_m_2cntr_err = 2*np.sqrt(bm*fm)/((bm+fm)**1.5)
-        asym_4cntr_err = r*np.sqrt(1./bp+1./bm+1./fp+1./fm)/((r+1)**2)
+        # get raw asymmetries and errors (two counter and four counter),
+        # packed into one block indexed [pm4][value, error][freq][time bin]
+        # so the outputs and the wrapped arrays below are all views of it
+        raw = np.empty((3, 2, nsplit, ndwell))
+        (raw[0, 0], raw[0, 1],
+         raw[1, 0], raw[1, 1],
+         raw[2, 0], raw[2, 1]) = asy.get_2e_raw(fp, fm, bp, bm)
 
         # save to output
-        out['raw_p'] = np.array([asym_p_2cntr, asym_p_2cntr_err])
-        out['raw_n'] = np.array([asym_m_2cntr, asym_m_2cntr_err])
-        out['raw_c'] = np.array([asym_4cntr, asym_4cntr_err])
+        out['raw_p'], out['raw_n'], out['raw_c'] = raw
 
         # wrap asymmetry arrays into one for calculations [p, m, 4]
         # indexing is now [pm4][freq][time bin]
-        asym     = np.array([asym_p_2cntr,    asym_m_2cntr,    asym_4cntr])
-        asym_err = np.array([asym_p_2cntr_err, asym_m_2cntr_err, asym_4cntr_err])
+        asym = raw[:, 0]
+        asym_err = raw[:, 1]
 
         # compute differenced asymmetries via slopes from weighted least squares
         # minimization.
         if ndwell >= 5:
 
-            # calculate needed components element-wise
+            # calculate needed components element-wise. Only w and w*y are
+            # materialized: the sums over w*x, w*x*y and w*x*x contract the
+            # time axis (ndwell, innermost and unit stride) with matmul
+            # against slices of the 1D time vector instead. nfreq, usually
+            # the large axis, stays outside — don't transpose this
             w = asym_err**-2
             x = time
-            y = asym
-
-            wx = w*x
-            wy = w*y
-            wxy = w*x*y
-            wxx = w*x*x
+            wy = w*asym
 
             # sum over values i < mid_time_i within each asymmetry and frequency
             # Indexing: [pm4][freq]
-            w_pre   = np.sum(w  [:, :, :mid_time_i], 2)
-            wx_pre  = np.sum(wx [:, :, :mid_time_i], 2)
-            wy_pre  = np.sum(wy [:, :, :mid_time_i], 2)
-            wxy_pre = np.sum(wxy[:, :, :mid_time_i], 2)
-            wxx_pre = np.sum(wxx[:, :, :mid_time_i], 2)
+            ws, wys, xs = w[..., :mid_time_i], wy[..., :mid_time_i], \
+                          x[:mid_time_i]
+            w_pre   = ws.sum(-1)
+            wx_pre  = ws @ xs
+            wy_pre  = wys.sum(-1)
+            wxy_pre = wys @ xs
+            wxx_pre = ws @ (xs*xs)
 
             # sum over values i > mid_time_i
-            w_pst   = np.sum(w  [:, :, -mid_time_i:], 2)
-            wx_pst  = np.sum(wx [:, :, -mid_time_i:], 2)
-            wy_pst  = np.sum(wy [:, :, -mid_time_i:], 2)
-            wxy_pst = np.sum(wxy[:, :, -mid_time_i:], 2)
-            wxx_pst = np.sum(wxx[:, :, -mid_time_i:], 2)
+            ws, wys, xs = w[..., -mid_time_i:], wy[..., -mid_time_i:], \
+                          x[-mid_time_i:]
+            w_pst   = ws.sum(-1)
+            wx_pst  = ws @ xs
+            wy_pst  = wys.sum(-1)
+            wxy_pst = wys @ xs
+            wxx_pst = ws @ (xs*xs)
 
             # calculate slopes and intercepts
             delta_pre = w_pre*wxx_pre - wx_pre**2
@@ -1712,22 +2063,21 @@ class bdata(mdata):
         """
 
         # check if fix is needed
-        if self.area.lower() == 'bnqr' and 2018 <= self.year <= 2020:
-            if self.year == 2020 and self.run > 45262:
-                return False
-            else:
+        if not self._prebeam_fix_candidate:
+            return False
 
-                n_prebeam = 0
-                try:
-                    n_prebeam = int(self._get_ppg('prebeam'))
-                except KeyError:
-                    pass
+        n_prebeam = 0
+        try:
+            n_prebeam = int(self._get_ppg('prebeam'))
+        except KeyError:
+            pass
 
-                # double check if fix is needed
-                if np.sum(np.array(self._get_area_data())[:, n_prebeam]) > 100:
-                    return False
+        # double check if fix is needed: sum one bin from each histogram
+        # rather than stacking them into a 2D array
+        if sum(di[n_prebeam] for di in self._get_area_data(copy=False)) > 100:
+            return False
 
-                return True
+        return True
 
     # ======================================================================= #
     def _kill_bins(self, d, ranges):
@@ -1740,28 +2090,22 @@ class bdata(mdata):
                     the final asymmetry calculation
         """
 
-        bin_ranges = []
-        for b in ranges:
-            if not '-' in b:
-                bin_ranges.append(int(b))
-            else:
-                one = int(b.split('-')[0])
-                two = int(b.split('-')[1])
-                bin_ranges.extend(np.arange(one, two+1))
+        # parse is memoized: the minuit loop passes the same ranges each call
+        bin_ranges = _parse_bin_ranges(tuple(ranges))
 
         # trivial exit
         if len(bin_ranges) == 0:
             return d
 
-        # kill bins
-        bin_ranges = np.array(bin_ranges)
-        for i in range(len(d)):
-
-            # get good bin range
-            idx = (bin_ranges>=0)*(bin_ranges<len(d[i]))
+        # build the kill mask once, sized to the longest counter, then
+        # apply a truncated view of it to each counter
+        maxlen = max(len(di) for di in d)
+        mask = np.zeros(maxlen, dtype=bool)
+        mask[bin_ranges[bin_ranges < maxlen]] = True
 
-            # kill
-            d[i][bin_ranges[idx]] = 0.
+        # kill bins
+        for di in d:
+            di[mask[:len(di)]] = 0.
 
         return d
 
@@ -1778,35 +2122,46 @@ class bdata(mdata):
         flatten_final_asym = False
         split_scan = False
 
-        # parse input options
+        # parse input options: classify each token in a single pass
         if options:
 
-            # split and strip
-            options = options.split(':')
-            options = list(map(str.strip, options))
-            options = [opt for opt in options if opt]
+            flags = set()
+            bad = []
+            found_bins = False
 
-            # check baseline correction bins
-            for opt in options:
-                try:
-                    baseline_bins = int(opt)
-                except ValueError:
-                    pass
+            for opt in options.split(':'):
+                opt = opt.strip()
+
+                if not opt:
+                    continue
+
+                # known flags
+                if opt in ('omit', 'overcorrect',
+                           'scan_raw', 'scan_mean', 'scan_sum'):
+                    flags.add(opt)
+
+                # first integer token sets the baseline correction bins
+                elif not found_bins:
+                    try:
+                        baseline_bins = int(opt)
+                    except ValueError:
+                        bad.append(opt)
+                    else:
+                        found_bins = True
                 else:
-                    del options[options.index(opt)]
-                    break
+                    bad.append(opt)
 
             # check flags
-            omit_incomplete_scan = 'omit' in options
-            flatten_final_asym = 'overcorrect' in options
+            omit_incomplete_scan = 'omit' in flags
+            flatten_final_asym = 'overcorrect' in flags
 
             # get scan combination function
-            if 'scan_raw' in options:
+            if 'scan_raw' in flags:
                 scan_comb_fn = lambda d, freq : (freq, d)
                 split_scan = True
-            elif 'scan_mean' in options:
+            elif 'scan_mean' in flags:
                 scan_comb_fn = self._get_1f_mean_scans
-            elif 'scan_sum' in options:
+            elif 'scan_sum' in flags:
                 scan_comb_fn = self._get_1f_sum_scans
 
             # check input
@@ -1816,12 +2171,9 @@ class bdata(mdata):
                                    "baseline corrction")
 
             # check for unused options
-            for opt in ('omit', 'overcorrect', 'scan_mean', 'scan_sum', 'scan_raw'):
-                if opt in options:
-                    del options[options.index(opt)]
-            if options:
+            if bad:
                 print('%d.%d: Bad scan_repair_options: %s' % \
-                        (self.year, self.run, ', '.join(options)))
+                        (self.year, self.run, ', '.join(bad)))
 
         return (scan_comb_fn,
                 baseline_bins,
@@ -1840,35 +2192,92 @@ class bdata(mdata):
             Returns [x, dx] after rebinning.
         """
 
-        x = xdx[0]
-        dx = xdx[1]
+        x = np.asarray(xdx[0], dtype=float)
+        dx = np.asarray(xdx[1], dtype=float)
         rebin = int(rebin)
 
         # easy end condition
         if rebin <= 1:
             return (x, dx)
 
-        # Rebin Discard unused bins
-        lenx = len(x)
-        x_rebin = []
-        dx_rebin = []
+        # called through the class so the helpers stay usable unbound
+        return bdata._rebin_many(self, np.array([[x, dx]]), rebin)[0]
+
+    # ======================================================================= #
+    def _rebin_many(self, xdx, rebin):
+        """
+            Rebin a stack of arrays with weights 1/dx**2 by factor rebin, in
+            one batched pass.
+
+            Inputs:
+                xdx = array of shape (k, 2, n): k pairs of [x, dx]
+                rebin = int
+            Returns array of shape (k, 2, ceil(n/rebin)) after rebinning.
+        """
 
-        # avoid dividing by zero
-        dx[dx==0] = np.inf
+        xdx = np.asarray(xdx, dtype=float)
+        rebin = int(rebin)
 
-        # weighted mean
-        for i in np.arange(0, lenx, rebin):
-            w = 1./dx[i:i+rebin]**2
-            wsum = np.sum(w)
+        # easy end condition
+        if rebin <= 1:
+            return xdx
 
-            if wsum == 0:
-                x_rebin.append(np.mean(x[i:i+rebin]))
-                dx_rebin.append(np.std(x[i:i+rebin]))
-            else:
-                x_rebin.append(np.sum(x[i:i+rebin]*w)/wsum)
-                dx_rebin.append(1./wsum**0.5)
+        x = xdx[:, 0]
+        dx = xdx[:, 1]
+
+        # segment start indices, the last segment may be ragged
+        lenx = x.shape[1]
+        idx = np.arange(0, lenx, rebin)
+
+        # weights, leaving the caller's dx untouched: zero-error bins
+        # contribute zero weight, same as the old dx==0 -> inf replacement
+        w = np.zeros_like(dx)
+        np.divide(1., dx*dx, out=w, where=dx!=0)
+
+        # weighted mean per segment
+        wsum = np.add.reduceat(w, idx, axis=1)
+        x_rebin = np.add.reduceat(x*w, idx, axis=1)
+
+        good = wsum > 0
+        np.divide(x_rebin, wsum, out=x_rebin, where=good)
+
+        dx_rebin = np.zeros_like(wsum)
+        np.divide(1., np.sqrt(wsum, out=wsum, where=good),
+                  out=dx_rebin, where=good)
+
+        # segments with no weight: fall back to the plain mean and std
+        if not good.all():
+            bad = ~good
+            counts = np.diff(np.append(idx, lenx))
+            means = np.add.reduceat(x, idx, axis=1)/counts
+            var = np.add.reduceat(x*x, idx, axis=1)/counts - means*means
+            x_rebin[bad] = means[bad]
+            dx_rebin[bad] = np.sqrt(np.maximum(var, 0.))[bad]
+
+        return np.stack((x_rebin, dx_rebin), axis=1)
+
+    # ======================================================================= #
+    def _set_area_flags(self):
+        """
+            Cache the uppercase area comparisons used throughout the
+            asymmetry paths, avoiding a string allocation per call.
+        """
 
-        return np.array([x_rebin, dx_rebin])
+        area = self.area.upper() if isinstance(self.area, str) else ''
+        self._area_upper = area
+        self._is_bnmr = area == 'BNMR'
+        self._is_bnqr = area == 'BNQR'
+
+        # candidate for the NQR prebeam off-by-one error: 2018 through
+        # run 45262 of 2020, inclusive. year/run may not be scalar for
+        # merged objects, in which case skip the fix
+        try:
+            self._prebeam_fix_candidate = bool(
+                self._is_bnqr
+                and 2018 <= self.year <= 2020
+                and not (self.year == 2020 and self.run > 45262))
+        except (TypeError, ValueError):
+            self._prebeam_fix_candidate = False
 
     # ======================================================================= #
     def _split_scan(self, freq, scan, omit_incomplete_scan=False):
@@ -2162,125 +2571,170 @@ class bdata(mdata):
         option = option.lower()
         option = self.option.get(option, option)
 
+        # bind the dispatch values once
+        mode = self.mode
+        xlab = self.mode1_dict.get(mode)
+
         # get data
         d = self._get_area_data(nbm=nbm, hist_select=hist_select) # 1+ 2+ 1- 2-
 
         # get alpha diffusion data
-        if self.mode == '2h':
+        if mode == '2h':
             d_alpha = d[4:]
             d = d[:4]
 
         # SLR -----------------------------------------------------------------
-        if self.mode in ("20", '2h', "00"):
-
-            # deadtime correction
+        if mode in ("20", '2h', "00"):
+
+            # deadtime correction, memoized in a single-slot cache: repeat
+            # calls with the same settings (the minuit loop in get_deadtime)
+            # skip the correction. downstream calculators no longer write to
+            # their inputs, so sharing the arrays between calls is safe.
+            # setdefault through __dict__, else bjoined builds an mlist
+            cache = self.__dict__.setdefault('_asym_cache', {})
+            key = (deadtime, nbm, hist_select)
+            if cache.get('key') == key:
+                d = cache['d']
+            else:
+                d = self._correct_deadtime(d, deadtime)
+                cache['key'] = key
+                cache['d'] = d
 
-            d = self._correct_deadtime(d, deadtime)
+            # rebinning helper: at rebin=1 pass through as (val, err)
+            # without entering _rebin
+            if rebin > 1:
+                rb = lambda xdx: self._rebin(xdx, rebin)
+            else:
+                rb = lambda xdx: (xdx[0], xdx[1])
 
             # get helicity data
             if option not in ('combined', 'forward_counter', 'backward_counter'):
-                h = np.array(self._get_asym_hel(d))
+                h = np.asarray(self._get_asym_hel(d))
             elif option in ('forward_counter', 'backward_counter'):
-                h = np.array(self._get_asym_counter(d))
+                h = np.asarray(self._get_asym_counter(d))
 
             # time
             time = self.get_time(n = len(d[0]), rebin=rebin)
 
             # mode switching
             if option in ('positive', 'forward_counter'): # ---------------------------------------
-                return np.vstack([time, self._rebin(h[0], rebin)])
+                return np.vstack([time, rb(h[0])])
 
             elif option in ('negative', 'backward_counter'): # -------------------------------------
-                return np.vstack([time, self._rebin(h[1], rebin)])
+                return np.vstack([time, rb(h[1])])
 
             elif option == 'helicity': # -------------------------------------
                 out = mdict()
-                out['p'] = self._rebin(h[0], rebin)
-                out['n'] = self._rebin(h[1], rebin)
+                out['p'] = rb(h[0])
+                out['n'] = rb(h[1])
                 out['time_s'] = time
                 return out
 
             elif option == 'counter': # -------------------------------------
                 out = mdict()
 
-                if self.area.upper() == 'BNMR':
-                    out['f'] = self._rebin(h[0], rebin)
-                    out['b'] = self._rebin(h[1], rebin)
-                elif self.area.upper() == 'BNQR':
-                    out['r'] = self._rebin(h[0], rebin)
-                    out['l'] = self._rebin(h[1], rebin)
+                if self._is_bnmr:
+                    out['f'] = rb(h[0])
+                    out['b'] = rb(h[1])
+                elif self._is_bnqr:
+                    out['r'] = rb(h[0])
+                    out['l'] = rb(h[1])
 
                 out['time_s'] = time
                 return out
 
             elif option == 'combined': # -------------------------------------
-                c = np.array(self._get_asym_comb(d))
-                return np.vstack([time, self._rebin(c, rebin)])
+                c = np.asarray(self._get_asym_comb(d))
+                return np.vstack([time, rb(c)])
 
             elif option == 'alpha_diffusion': # ------------------------------
                 try:
                     asym = self._get_asym_alpha(d_alpha, d)
                 except UnboundLocalError as err:
-                    if self.mode != '2h':
+                    if mode != '2h':
                         raise InputError('Run is not in 2h mode.')
-                return np.vstack([time, self._rebin(asym, rebin)])
+                return np.vstack([time, rb(asym)])
 
             elif option == 'alpha_tagged': # ---------------------------------
                 try:
                     asym = self._get_asym_alpha_tag(d_alpha, d)
                 except UnboundLocalError as err:
-                    if self.mode != '2h':
+                    if mode != '2h':
                         raise InputError('Run is not in 2h mode.')
                     else:
                         raise err
 
                 out = mdict()
-                out['p_wiA'] = self._rebin(asym[0][0], rebin)
-                out['n_wiA'] = self._rebin(asym[0][1], rebin)
-                out['p_noA'] = self._rebin(asym[1][0], rebin)
-                out['n_noA'] = self._rebin(asym[1][1], rebin)
-                out['p_noT'] = self._rebin(asym[2][0], rebin)
-                out['n_noT'] = self._rebin(asym[2][1], rebin)
-                out['c_wiA'] = self._rebin(asym[3], rebin)
-                out['c_noA'] = self._rebin(asym[4], rebin)
-                out['c_noT'] = self._rebin(asym[5], rebin)
+
+                # rebin all nine curves in one batched pass
+                keys = ('p_wiA', 'n_wiA', 'p_noA', 'n_noA', 'p_noT',
+                        'n_noT', 'c_wiA', 'c_noA', 'c_noT')
+                curves = (asym[0][0], asym[0][1], asym[1][0], asym[1][1],
+                          asym[2][0], asym[2][1], asym[3], asym[4], asym[5])
+
+                if rebin > 1:
+                    rebinned = self._rebin_many(np.array(curves), rebin)
+                else:
+                    rebinned = [rb(c) for c in curves]
+
+                for key, val in zip(keys, rebinned):
+                    out[key] = val
+
                 out['time_s'] = time
 
                 return out
 
             else:
-                h = np.array(self._get_asym_hel(d))
-                c = np.array(self._get_asym_comb(d))
-                ctr = np.array(self._get_asym_counter(d))
+                # stack the helicity and combined curves into one (3, 2, n)
+                # buffer so rebinning runs as a single batched pass. the
+                # counter asymmetries were also computed here historically,
+                # but the output never used them
+                hc = np.asarray((*self._get_asym_hel(d),
+                                 self._get_asym_comb(d)))
+
+                if rebin > 1:
+                    hel_p, hel_n, comb = self._rebin_many(hc, rebin)
+                else:
+                    hel_p, hel_n, comb = (rb(x) for x in hc)
 
                 out = mdict()
-                out['p'] = self._rebin(h[0], rebin)
-                out['n'] = self._rebin(h[1], rebin)
+                out['p'] = hel_p
+                out['n'] = hel_n
 
-                if self.area.upper() == 'BNMR':
-                    out['f'] = self._rebin(h[0], rebin)
-                    out['b'] = self._rebin(h[1], rebin)
-                elif self.area.upper() == 'BNQR':
-                    out['r'] = self._rebin(h[0], rebin)
-                    out['l'] = self._rebin(h[1], rebin)
+                if self._is_bnmr:
+                    out['f'] = hel_p
+                    out['b'] = hel_n
+                elif self._is_bnqr:
+                    out['r'] = hel_p
+                    out['l'] = hel_n
 
-                out['c'] = self._rebin(c, rebin)
+                out['c'] = comb
                 out['time_s'] = time
                 return out
 
         # 1F ------------------------------------------------------------------
-        elif self.mode in self.mode1_dict.keys(): # ('1f', '1n', '1w', '1e', '1c', '1d', '1x')
+        elif xlab is not None: # ('1f', '1n', '1w', '1e', '1c', '1d', '1x')
 
             # get xaxis label and data key
-            xlab = self.mode1_dict[self.mode]
             if 'Custom EPICS scan' in self.hist.keys():
                 xlab = 'custom'
 
-            # deadtime correction
-            d = self._correct_deadtime(d, deadtime)
+            # deadtime correction and user bin removal, memoized as in the
+            # SLR branch. bin killing is idempotent, so a cache hit holding
+            # already-killed counters is unaffected by the re-key
+            cache = self.__dict__.setdefault('_asym_cache', {})
+            key = (deadtime, nbm, hist_select, tuple(further_options))
+            if cache.get('key') == key:
+                d = cache['d']
+            else:
+                d = self._correct_deadtime(d, deadtime)
 
-            # set bins to zero based on user input (exclude from final calculation)
-            d = self._kill_bins(d, ranges=further_options)
+                # set bins to zero based on user input (exclude from final
+                # calculation)
+                d = self._kill_bins(d, ranges=further_options)
+
+                cache['key'] = key
+                cache['d'] = d
 
             # get frequency
             freq = self._get_xhist()
@@ -2298,31 +2752,28 @@ class bdata(mdata):
                     assert len(freq_p) == len(freq_n)
                     out['p'] = np.array([np.concatenate(p[0]), np.concatenate(p[1])])
                     out['n'] = np.array([np.concatenate(n[0]), np.concatenate(n[1])])
-                    out[xlab] = np.array(np.concatenate(freq_p))
+                    out[xlab] = np.asarray(np.concatenate(freq_p))
 
                 # simply report the scans
                 elif option == 'raw_split_scan':
 
-                    # remove empty scans
-                    p_out = []
-                    n_out = []
-                    fp_out = []
-                    fn_out = []
+                    # remove empty scans: compute the per-scan sums once,
+                    # then filter both the scans and their frequencies
+                    keep_p = [np.sum(pi[0]) > 0 for pi in p]
+                    keep_n = [np.sum(ni[0]) > 0 for ni in n]
 
-                    for pi, fi in zip(p, freq_p):
-                        if sum(pi[0]) > 0:
-                            p_out.append(pi)
-                            fp_out.append(fi)
+                    p_out = [pi for pi, k in zip(p, keep_p) if k]
+                    fp_out = [fi for fi, k in zip(freq_p, keep_p) if k]
 
-                    for ni, fi in zip(n, freq_n):
-                        if sum(ni[0]) > 0:
-                            n_out.append(ni)
-                            fn_out.append(fi)
+                    n_out = [ni for ni, k in zip(n, keep_n) if k]
+                    fn_out = [fi for fi, k in zip(freq_n, keep_n) if k]
 
-                    out['p'] = np.array(p_out, dtype=object)
-                    out['n'] = np.array(n_out, dtype=object)
-                    out[xlab + '_p'] = np.array(fp_out, dtype=object)
-                    out[xlab + '_n'] = np.array(fn_out, dtype=object)
+                    # plain lists of float arrays: object-dtype wrappers
+                    # would only box the ragged scans per element
+                    out['p'] = p_out
+                    out['n'] = n_out
+                    out[xlab + '_p'] = fp_out
+                    out[xlab + '_n'] = fn_out
 
                 # bad input
                 else:
@@ -2332,49 +2783,49 @@ class bdata(mdata):
                 return out
 
 
-            # calculate asymmetry
+            # calculate asymmetry: only the kinds the option asks for,
+            # driven by the class-level table. unrecognized options compute
+            # nothing, as before
             asym = mdict()
-            if option in ('helicity', 'positive', ''):
-                asym[xlab], asym['p'] = self._get_asym_pos(d,
-                                               options=scan_repair_options,
-                                               freq=freq)
-            if option in ('helicity', 'negative', ''):
-                asym[xlab], asym['n'] = self._get_asym_neg(d,
-                                               options=scan_repair_options,
-                                               freq=freq)
-            if option in ('counter', 'backward_counter', ''):
-                asym[xlab], asym['b'] = self._get_asym_bck(d,
-                                               options=scan_repair_options,
-                                               freq=freq)
-            if option in ('counter', 'forward_counter', ''):
-                asym[xlab], asym['f'] = self._get_asym_fwd(d,
-                                               options=scan_repair_options,
-                                               freq=freq)
-            if option in ('combined', ''):
-                asym[xlab], asym['c'] = self._get_asym_comb(d,
+            asym_fns = {'p': self._get_asym_pos,
+                        'n': self._get_asym_neg,
+                        'b': self._get_asym_bck,
+                        'f': self._get_asym_fwd,
+                        'c': self._get_asym_comb}
+
+            for kind in self._OPT_MAP.get(option, ()):
+                asym[xlab], asym[kind] = asym_fns[kind](d,
                                                options=scan_repair_options,
                                                freq=freq)
 
             # rebin
             if rebin > 1:
-                for key in asym.keys():
-
-                    # rebin frequencies
-                    if key == xlab:
-                        len_f = len(asym[key])
-                        newf = (np.average(asym[key][i:i+rebin-1]) for i in range(0, len_f, rebin))
-                        asym[key] = np.fromiter(newf, dtype=float, count=int(np.ceil(len_f/rebin)))
 
-                    # rebin asymmetries
-                    else:
-                        asym[key] = self._rebin(asym[key], rebin)
+                # rebin frequencies with a reshape-mean, averaging the
+                # ragged tail separately. The old generator sliced
+                # rebin-1 wide windows, silently dropping the last
+                # frequency of each group
+                f = asym[xlab]
+                len_f = len(f)
+                m = (len_f//rebin)*rebin
+                newf = f[:m].reshape(-1, rebin).mean(axis=1)
+                if m < len_f:
+                    newf = np.concatenate((newf, [f[m:].mean()]))
+                asym[xlab] = newf
+
+                # rebin all asymmetries in one batched pass
+                ks = [k for k in asym.keys() if k != xlab]
+                rebinned = self._rebin_many(np.array([asym[k] for k in ks]),
+                                            rebin)
+                for key, val in zip(ks, rebinned):
+                    asym[key] = val
 
             # format output: NQR counters
-            if self.area.upper() == 'BNQR' and 'f' in asym.keys():
+            if self._is_bnqr and 'f' in asym.keys():
                 asym['r'] = asym['f']
                 del asym['f']
 
-            if self.area.upper() == 'BNQR' and 'b' in asym.keys():
+            if self._is_bnqr and 'b' in asym.keys():
                 asym['l'] = asym['b']
                 del asym['b']
 
@@ -2382,12 +2833,20 @@ class bdata(mdata):
             if len(asym.keys()) == 2:
                 keys = list(asym.keys())
                 del keys[keys.index(xlab)]
-                asym = np.vstack([asym[xlab], asym[keys[0]]])
+
+                # fill a preallocated (3, n) block rather than vstack
+                x = asym[xlab]
+                a, da = asym[keys[0]]
+                out = np.empty((3, len(x)))
+                out[0] = x
+                out[1] = a
+                out[2] = da
+                asym = out
 
             return asym
 
         # 2E ------------------------------------------------------------------
-        elif self.mode in ('2e', ):
+        elif mode in ('2e', ):
             adict = self._get_2e_asym()
 
             if option == 'slope_combined':
@@ -2405,13 +2864,24 @@ class bdata(mdata):
             return
 
     # ======================================================================= #
-    @property
+    @functools.cached_property
     def beam_keV(self):     return self._beam_kev()
 
     # ======================================================================= #
-    @property
+    @functools.cached_property
     def beam_keV_err(self): return self._beam_kev(get_error=True)
 
+    # ======================================================================= #
+    # frequently used ppg means, cached on first access (immutable metadata)
+    @functools.cached_property
+    def _ppg_dwelltime(self):   return self._get_ppg('dwelltime')
+
+    @functools.cached_property
+    def _ppg_beam_on(self):     return self._get_ppg('beam_on')
+
+    @functools.cached_property
+    def _ppg_beam_off(self):    return self._get_ppg('beam_off')
+
     # ======================================================================= #
     def get_deadtime(self, dt=1e-9, c=1, return_minuit=False, fixed='c'):
         """
@@ -2433,28 +2903,26 @@ class bdata(mdata):
                 if both parameters fixed, return the chi2 value
         """
 
+        # import here: iminuit is slow to load and most sessions never fit
+        from iminuit import Minuit
+
         # check run mode
         if '2' not in self.mode:
             raise RuntimeError('Deadtimes only estimatable in time differentiated mode')
 
+        # memoize the expensive asym evaluation: minuit revisits the same
+        # dt_ns repeatedly while varying c (always, when dt is fixed). local
+        # closure, so the cache dies with this call and holds no self ref
+        @functools.lru_cache(maxsize=64)
+        def get_hel_asym(dt_ns):
+            asym = self.asym('h', deadtime=dt_ns*1e-9)
+            return (*asym['p'], *asym['n'])
+
         # make chi2 function: compare the midpoint of the split helicity
         # to the total average value, which is somewhere in the middle
         def chi(dt_ns, c):
-
-            # get split hel asym
-            asym = self.asym('h', deadtime=dt_ns*1e-9)
-            p, dp = asym['p']
-            n, dn = asym['n']
-
-            # midpoints
-            midpts = 0.5*(p+c*n)
-            dmidpts2 = 0.25*(dp**2 + (c*dn)**2)
-
-            # weighted average midpoint
-            avgmid = np.average(midpts, weights=1/dmidpts2)
-
-            # get chi2
-            return np.mean( ((midpts-avgmid)**2)/dmidpts2 )
+            p, dp, n, dn = get_hel_asym(dt_ns)
+            return _deadtime_chi(p, dp, n, dn, c)
 
 
         # search for best chi2
@@ -2508,12 +2976,10 @@ class bdata(mdata):
 
         # get n from ppg parameters
         if n <= 0:
-            beam_on = self._get_ppg('beam_on')
-            beam_off = self._get_ppg('beam_off')
-            n = beam_on + beam_off + n_prebeam
+            n = self._ppg_beam_on + self._ppg_beam_off + n_prebeam
 
         # get time array
-        time = (np.arange(n)+0.5)*self._get_ppg('dwelltime')/1000
+        time = (np.arange(n)+0.5)*self._ppg_dwelltime/1000
 
         # NQR error
         if self._is_prebeam_offbyone():
@@ -2528,25 +2994,78 @@ class bdata(mdata):
         else:
             time -= time[n_prebeam]
 
-        # rebin time
+        # rebin time: reshape-and-mean the full segments, then average the
+        # ragged tail separately
         if rebin > 1:
-            new_t_idx = np.arange(0, n, rebin)
-            new_time = (np.average(time[i:i+rebin]) for i in new_t_idx)
-            time = np.fromiter(new_time, dtype=float, count=len(new_t_idx))
+            m = (n//rebin)*rebin
+            head = time[:m].reshape(-1, rebin).mean(axis=1)
+            if m < n:
+                time = np.concatenate((head, [time[m:].mean()]))
+            else:
+                time = head
 
         return time
 
     # ======================================================================= #
-    @property
+    @classmethod
+    def prefetch(cls, run_numbers, year=None):
+        """
+            Download any of run_numbers missing locally, in parallel.
+
+            run_numbers:    iterable of int run numbers
+            year:           int, year of runs. Default is current year.
+
+            Fetches over a single requests.Session so the connection is
+            reused, with a thread pool to hide per-request latency. Useful
+            ahead of batch loads like [bdata(r) for r in runs].
+        """
+
+        # Get the current year
+        if year is None:   year = time.localtime().tm_year
+
+        # find the misses
+        missing = []
+        for run_number in run_numbers:
+
+            # Get spectrometer directory
+            if run_number >= 40000 and run_number <= 44999:
+                spect_dir = "bnmr"
+                directory = _get_data_dir(spect_dir, cls.evar_bnmr, year)
+            elif run_number >= 45000 and run_number <= 49999:
+                spect_dir = "bnqr"
+                directory = _get_data_dir(spect_dir, cls.evar_bnqr, year)
+            else:
+                raise ValueError("Run number out of range")
+
+            run = '%06d.msr' % run_number
+            if not os.path.isfile(os.path.join(directory, run)):
+                missing.append((spect_dir, run, directory))
+
+        if not missing:
+            return
+
+        # fetch in parallel: downloads are I/O bound so threads overlap
+        with requests.Session() as session, \
+             ThreadPoolExecutor(max_workers=8) as pool:
+
+            futures = [pool.submit(cls._download, spect_dir, run, year,
+                                   directory, session=session)
+                       for spect_dir, run, directory in missing]
+
+            for f in futures:
+                f.result()
+
+    # ======================================================================= #
+    @functools.cached_property
     def pulse_s(self):
         """Get pulse duration in seconds, for pulsed measurements."""
 
         try:
-            dwelltime = self._get_ppg('dwelltime')
+            dwelltime = self._ppg_dwelltime
         except KeyError:
             raise AttributeError("Missing ppg parameter: dwelltime") from None
         try:
-            beam_on = self._get_ppg('beam_on')
+            beam_on = self._ppg_beam_on
         except KeyError:
             raise AttributeError("Missing ppg parameter: beam_on") from None
 
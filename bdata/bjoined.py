@@ -31,7 +31,11 @@ class bjoined(bdata):
         # set some calculation-required parameters
         for c in self.common:
             self._set_common(c)
-        
+
+        # cache area comparisons: must be instance attributes, else
+        # __getattr__ builds them as mlists from the underlying data
+        self._set_area_flags()
+
         # combine the histograms
         self._combine_hist()
     
@@ -9,6 +9,9 @@ import numpy as np
 import pandas as pd
 import re, warnings, copy
 
+# name delimiters in the experimenter field, compiled once
+_NAME_SPLIT_RE = re.compile('[:, ]')
+
 class bmerged(bdata):
     """
         Object to store lists or the combination of bdata objects, emulates
@@ -60,6 +63,9 @@ class bmerged(bdata):
                 
             setattr(self, top, d)
             
+        # cache area comparisons
+        self._set_area_flags()
+
         # combine the histograms
         self._combine_hist(bdata_list)
         
@@ -211,7 +217,7 @@ class bmerged(bdata):
                 # remove duplicates
                 all_names = []
                 for i in x:
-                    all_names.extend(re.split('[:, ]', i))
+                    all_names.extend(_NAME_SPLIT_RE.split(i))
                 all_names = np.unique(all_names)
                 all_names = all_names[all_names!='']
                 return ', '.join(all_names)
@@ -0,0 +1,48 @@
+# Test the weighted rebinning helper
+# Derek Fujimoto
+# Sep 2025
+
+from bdata import bdata
+from numpy.testing import *
+import numpy as np
+
+def test_rebin_weighted_mean():
+    x = np.array([1., 3., 2., 6.])
+    dx = np.array([1., 1., 1., 1.])
+
+    out = bdata._rebin(None, [x, dx], 2)
+
+    assert_array_almost_equal(out[0], [2., 4.])
+    assert_array_almost_equal(out[1], [1/np.sqrt(2), 1/np.sqrt(2)])
+
+def test_rebin_uneven_tail():
+    x = np.array([1., 3., 5.])
+    dx = np.array([1., 1., 2.])
+
+    out = bdata._rebin(None, [x, dx], 2)
+
+    # last bin is ragged: it holds only the final point
+    assert_array_almost_equal(out[0], [2., 5.])
+    assert_array_almost_equal(out[1], [1/np.sqrt(2), 2.])
+
+def test_rebin_zero_errors():
+    x = np.array([1., 3., 2., 6.])
+    dx = np.array([0., 0., 1., 0.])
+
+    out = bdata._rebin(None, [x, dx], 2)
+
+    # all-zero-error bins fall back to the mean and std
+    assert_array_almost_equal(out[0], [2., 2.])
+    assert_array_almost_equal(out[1], [1., 1.])
+
+    # input errors are not modified
+    assert_array_equal(dx, [0., 0., 1., 0.])
+
+def test_rebin_noop():
+    x = np.array([1., 2.])
+    dx = np.array([3., 4.])
+
+    out = bdata._rebin(None, [x, dx], 1)
+
+    assert_array_equal(out[0], x)
+    assert_array_equal(out[1], dx)
@@ -0,0 +1,71 @@
+# Test the 1f scan combination functions
+# Derek Fujimoto
+# Sep 2025
+
+from bdata import bdata
+from numpy.testing import *
+import numpy as np
+
+def test_mean_scans():
+    freq = np.array([1., 2., 1., 2.])
+    d = [np.array([1., 2., 3., 4.]),
+         np.array([0., 2., 3., 2.])]
+
+    x, out = bdata._get_1f_mean_scans(None, d, freq)
+
+    assert_array_equal(x, [1., 2.])
+
+    # zeros are excluded from the average
+    assert_array_equal(out[0], [2., 3.])
+    assert_array_equal(out[1], [3., 2.])
+
+def test_sum_scans():
+    freq = np.array([1., 2., 1., 2.])
+    d = [np.array([1., 2., 3., 4.]),
+         np.array([0., 2., 3., 2.])]
+
+    x, out = bdata._get_1f_sum_scans(None, d, freq)
+
+    assert_array_equal(x, [1., 2.])
+    assert_array_equal(out[0], [4., 6.])
+    assert_array_equal(out[1], [3., 4.])
+
+def test_sum_scans_nan_excluded():
+    # nan marks bins dropped by the baseline correction: they sum as
+    # zero, as with the pandas groupby sum
+    freq = np.array([1., 2., 1., 2.])
+    d = [np.array([1., np.nan, 3., 4.])]
+
+    x, out = bdata._get_1f_sum_scans(None, d, freq)
+    assert_array_equal(out[0], [4., 4.])
+
+    # same on the single-scan fast path
+    freq = np.array([1., 2.])
+    d = [np.array([np.nan, 5.])]
+
+    x, out = bdata._get_1f_sum_scans(None, d, freq)
+    assert_array_equal(out[0], [0., 5.])
+
+def test_single_scan_fast_path():
+    # unique frequencies take the reorder shortcut in both combiners
+    freq = np.array([3., 1., 2.])
+    d = [np.array([5., 0., 7.])]
+
+    x, out = bdata._get_1f_mean_scans(None, [d[0].copy()], freq.copy())
+    assert_array_equal(x, [1., 2., 3.])
+    assert np.isnan(out[0][0])
+    assert_array_equal(out[0][1:], [7., 5.])
+
+    x, out = bdata._get_1f_sum_scans(None, [d[0].copy()], freq.copy())
+    assert_array_equal(x, [1., 2., 3.])
+    assert_array_equal(out[0], [0., 7., 5.])
+
+def test_mean_scans_empty_bin():
+    freq = np.array([1., 2.])
+    d = [np.array([0., 5.])]
+
+    x, out = bdata._get_1f_mean_scans(None, d, freq)
+
+    # a frequency with no positive counts averages to nan
+    assert np.isnan(out[0][0])
+    assert out[0][1] == 5.